@@ -3,73 +3,71 @@
 Script to add all products from shop.html to the database
 """
 
-import re
+import argparse
+import csv
+import io
 import psycopg2
 import os
 from dotenv import load_dotenv
 
+from shop_products_parser import iter_js_array
+
 # Load environment variables
 load_dotenv()
 
+def iter_products_from_html(path='pages/shop.html'):
+    """Yield product dicts from the allProducts array in shop.html, one at a time"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for entry in iter_js_array(f, 'allProducts'):
+            if not isinstance(entry, dict) or 'title' not in entry:
+                print(f"Skipping unrecognised allProducts entry: {entry!r}")
+                continue
+
+            image_path = str(entry.get('image', ''))
+            title = str(entry['title'])
+            collection = str(entry.get('collection', ''))
+            price = str(entry.get('price', ''))
+
+            # Convert image path to database format
+            if image_path.startswith('../etsy_images/'):
+                image_path = image_path.replace('../etsy_images/', 'etsy_images/')
+
+            # Extract price as number
+            price_str = price.replace('$', '').replace(',', '')
+            try:
+                price_value = float(price_str)
+                original_price = price_value * 1.2  # 20% markup for original price
+            except ValueError:
+                price_value = 22.00
+                original_price = 26.40
+
+            # Use the exact title from frontend (the parser already decoded escaped apostrophes)
+            product_name = title
+
+            yield {
+                'name': product_name,  # Exact name from frontend
+                'description': f"Quality printed design - {product_name}",
+                'price': price_value,
+                'original_price': original_price,
+                'image_url': image_path,
+                'category': collection.replace(' Collection', ''),
+                'subcategory': 'Featured',
+                'tags': ['custom', 'printed', 'quality'],
+                'stock_quantity': 50,
+                'is_featured': True,
+                'is_on_sale': True,
+                'sale_percentage': 15
+            }
+
 def extract_products_from_html():
     """Extract product data from shop.html"""
     products = []
-    
-    with open('pages/shop.html', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Find the allProducts array
-    pattern = r"const allProducts = \[(.*?)\];"
-    match = re.search(pattern, content, re.DOTALL)
-    
-    if not match:
-        print("Could not find allProducts array in shop.html")
-        return []
-    
-    products_text = match.group(1)
-    
-    # Use a more sophisticated regex that properly handles escaped apostrophes
-    # This pattern matches content between quotes, including escaped apostrophes
-    product_pattern = r"\{\s*image:\s*'((?:[^'\\]|\\.)*)',\s*title:\s*'((?:[^'\\]|\\.)*)',\s*collection:\s*'((?:[^'\\]|\\.)*)',\s*price:\s*'((?:[^'\\]|\\.)*)',\s*rating:\s*'((?:[^'\\]|\\.)*)'\s*\}"
-    product_matches = re.findall(product_pattern, products_text, re.DOTALL)
-    
-    for i, match in enumerate(product_matches):
-        image_path, title, collection, price, rating = match
-        
-        # Convert image path to database format
-        if image_path.startswith('../etsy_images/'):
-            image_path = image_path.replace('../etsy_images/', 'etsy_images/')
-        
-        # Extract price as number
-        price_str = price.replace('$', '').replace(',', '')
-        try:
-            price_value = float(price_str)
-            original_price = price_value * 1.2  # 20% markup for original price
-        except ValueError:
-            price_value = 22.00
-            original_price = 26.40
-        
-        # Use the exact title from frontend (including apostrophes)
-        # Convert escaped apostrophes back to regular ones
-        product_name = title.replace("\\'", "'")
-        
-        product = {
-            'name': product_name,  # Exact name from frontend
-            'description': f"Quality printed design - {product_name}",
-            'price': price_value,
-            'original_price': original_price,
-            'image_url': image_path,
-            'category': collection.replace(' Collection', ''),
-            'subcategory': 'Featured',
-            'tags': ['custom', 'printed', 'quality'],
-            'stock_quantity': 50,
-            'is_featured': True,
-            'is_on_sale': True,
-            'sale_percentage': 15
-        }
+    for product in iter_products_from_html():
         products.append(product)
-        print(f"Extracted product {len(products)}: {product_name}")
-    
+        print(f"Extracted product {len(products)}: {product['name']}")
+
+    if not products:
+        print("Could not find any products in the allProducts array in shop.html")
     return products
 
 def add_products_to_database(products):
@@ -117,7 +115,171 @@ def add_products_to_database(products):
         if conn:
             conn.close()
 
+PRODUCT_COLUMNS = [
+    'name', 'description', 'price', 'original_price', 'image_url', 'category',
+    'subcategory', 'tags', 'stock_quantity', 'is_featured', 'is_on_sale', 'sale_percentage'
+]
+
+def pg_array_literal(values):
+    """Format a Python list as a PostgreSQL text[] literal for COPY"""
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"') for v in values)
+    return '{' + ','.join(f'"{v}"' for v in escaped) + '}'
+
+def products_to_csv(products):
+    """Serialize products into an in-memory CSV buffer in PRODUCT_COLUMNS order"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for product in products:
+        row = []
+        for column in PRODUCT_COLUMNS:
+            value = product[column]
+            if column == 'tags':
+                value = pg_array_literal(value)
+            elif isinstance(value, bool):
+                value = 't' if value else 'f'
+            row.append(value)
+        writer.writerow(row)
+    buffer.seek(0)
+    return buffer
+
+# COPY (FORMAT csv) reads an unquoted empty field as NULL; these columns keep '' as '' (an
+# empty image_url or category), as the row-by-row insert stores them and sync matches them
+COPY_NOT_NULL_COLUMNS = ['name', 'description', 'image_url', 'category', 'subcategory']
+
+# Columns shop.html owns; sync only rewrites these on existing rows, so stock levels,
+# tags and sale flags edited in the admin dashboard are left alone
+SYNC_UPDATE_COLUMNS = ['description', 'price', 'original_price', 'category']
+
+# Natural key for matching shop.html entries to database rows
+SYNC_KEY_MATCH = "p.name = s.name AND p.image_url IS NOT DISTINCT FROM s.image_url"
+
+def stage_products(cursor, products):
+    """COPY products into a temporary products_staging table dropped at commit"""
+    columns = ', '.join(PRODUCT_COLUMNS)
+    cursor.execute(f"""
+        CREATE TEMP TABLE products_staging ON COMMIT DROP AS
+        SELECT {columns} FROM products WITH NO DATA
+    """)
+    not_null = ', '.join(COPY_NOT_NULL_COLUMNS)
+    cursor.copy_expert(f"COPY products_staging ({columns}) FROM STDIN "
+                       f"WITH (FORMAT csv, FORCE_NOT_NULL ({not_null}))",
+                       products_to_csv(products))
+    print(f"Staged {len(products)} products with COPY")
+
+def bulk_load_products(products):
+    """
+    Replace the products table using COPY into a staging table and one set-based swap.
+    The slow part (shipping every row) happens before the products table is touched,
+    and the swap itself is two statements in one transaction, so readers never see an
+    empty or half-loaded table.
+    """
+    conn = None
+    cursor = None
+    try:
+        conn = psycopg2.connect(os.getenv('DATABASE_URL'))
+        cursor = conn.cursor()
+
+        stage_products(cursor, products)
+
+        columns = ', '.join(PRODUCT_COLUMNS)
+        cursor.execute("DELETE FROM products")
+        cursor.execute(f"INSERT INTO products ({columns}) SELECT {columns} FROM products_staging")
+        inserted = cursor.rowcount
+
+        conn.commit()
+        print(f"\nSuccessfully bulk loaded {inserted} products into database")
+
+    except Exception as e:
+        print(f"Error bulk loading products: {e}")
+        if conn:
+            conn.rollback()
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def sync_products(products):
+    """
+    Diff shop.html against the products table on (name, image_url) instead of wiping it.
+    New products are inserted, changed ones updated in place (keeping their ids, so
+    order_items, wishlist and cart_items stay valid) and products no longer in shop.html
+    are soft-deleted with is_active = false. Rows that already match are not touched.
+    """
+    conn = None
+    cursor = None
+    try:
+        conn = psycopg2.connect(os.getenv('DATABASE_URL'))
+        cursor = conn.cursor()
+
+        stage_products(cursor, products)
+        # shop.html can list the same product twice; keep the first occurrence per key
+        cursor.execute("""
+            DELETE FROM products_staging a USING products_staging b
+            WHERE a.ctid > b.ctid AND a.name = b.name
+              AND a.image_url IS NOT DISTINCT FROM b.image_url
+        """)
+
+        cursor.execute("SELECT count(*) FROM products_staging")
+        staged = cursor.fetchone()[0]
+
+        assignments = ', '.join(f"{column} = s.{column}" for column in SYNC_UPDATE_COLUMNS)
+        current = ', '.join(f"p.{column}" for column in SYNC_UPDATE_COLUMNS)
+        incoming = ', '.join(f"s.{column}" for column in SYNC_UPDATE_COLUMNS)
+        differs = f"{SYNC_KEY_MATCH} AND ({current}, p.is_active) IS DISTINCT FROM ({incoming}, true)"
+        # Staged products that will update at least one row (one key can match several rows)
+        cursor.execute(f"""
+            SELECT count(*) FROM products_staging s
+            WHERE EXISTS (SELECT 1 FROM products p WHERE {differs})
+        """)
+        changed = cursor.fetchone()[0]
+        cursor.execute(f"""
+            UPDATE products p
+            SET {assignments}, is_active = true, updated_at = CURRENT_TIMESTAMP
+            FROM products_staging s
+            WHERE {differs}
+        """)
+        updated = cursor.rowcount
+
+        columns = ', '.join(PRODUCT_COLUMNS)
+        cursor.execute(f"""
+            INSERT INTO products ({columns})
+            SELECT {columns} FROM products_staging s
+            WHERE NOT EXISTS (SELECT 1 FROM products p WHERE {SYNC_KEY_MATCH})
+        """)
+        inserted = cursor.rowcount
+
+        cursor.execute(f"""
+            UPDATE products p
+            SET is_active = false, updated_at = CURRENT_TIMESTAMP
+            WHERE p.is_active = true
+              AND NOT EXISTS (SELECT 1 FROM products_staging s WHERE {SYNC_KEY_MATCH})
+        """)
+        deactivated = cursor.rowcount
+
+        conn.commit()
+        unchanged = staged - changed - inserted
+        print(f"\nSync complete: {staged} distinct products, {inserted} inserted, {updated} updated, "
+              f"{deactivated} deactivated, {unchanged} unchanged")
+
+    except Exception as e:
+        print(f"Error syncing products: {e}")
+        if conn:
+            conn.rollback()
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
 def main():
+    parser = argparse.ArgumentParser(description="Add all products from shop.html to the database")
+    parser.add_argument('--bulk', action='store_true',
+                        help="load with COPY into a staging table and swap in one statement pair")
+    parser.add_argument('--sync', action='store_true',
+                        help="upsert by name + image and soft-delete missing products instead of wiping the table")
+    args = parser.parse_args()
+
     print("Extracting products from shop.html...")
     products = extract_products_from_html()
     
@@ -134,7 +296,12 @@ def main():
     
     # Add to database
     print("\nAdding products to database...")
-    add_products_to_database(products)
+    if args.sync:
+        sync_products(products)
+    elif args.bulk:
+        bulk_load_products(products)
+    else:
+        add_products_to_database(products)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
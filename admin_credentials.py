@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Non-interactive admin token provider for the Python tooling.
+Tokens come from, in order:
+    1. ADMIN_TOKEN                      (a JWT copied from the admin dashboard)
+    2. the token cache file             (ADMIN_TOKEN_FILE, default .admin_token)
+    3. POST /api/admin/login            (ADMIN_EMAIL + ADMIN_PASSWORD; when the server asks for
+                                         TOTP, /api/admin/totp/verify-login with ADMIN_TOTP_CODE
+                                         or a code generated from ADMIN_TOTP_SECRET)
+A token is reused until shortly before its `exp` claim and logins are written back to the
+cache file, so scheduled jobs log in at most once per token lifetime.
+
+Print a token for other tools:
+    python admin_credentials.py
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import struct
+import sys
+import time
+
+import requests
+
+from atomic_write import atomic_write
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+DEFAULT_API_URL = "http://localhost:3000"
+DEFAULT_TOKEN_FILE = ".admin_token"
+# Refresh this many seconds before the token actually expires
+EXPIRY_MARGIN = 60
+LOGIN_TIMEOUT = 10
+
+
+class AdminAuthError(Exception):
+    """Raised when no usable admin token can be obtained"""
+
+
+def jwt_expiry(token):
+    """The exp claim of a JWT (seconds since epoch), or None if it has none or is malformed"""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def token_is_fresh(token, now=None, margin=EXPIRY_MARGIN):
+    """True for a token that will not expire within the margin (tokens without exp count as fresh)"""
+    if not token:
+        return False
+    exp = jwt_expiry(token)
+    if exp is None:
+        return True
+    return exp - margin > (now if now is not None else time.time())
+
+
+def totp_code(secret, for_time=None, step=30, digits=6):
+    """RFC 6238 code for a base32 secret, as produced by Google Authenticator / speakeasy"""
+    secret = secret.replace(' ', '').upper()
+    key = base64.b32decode(secret + '=' * (-len(secret) % 8))
+    counter = int((for_time if for_time is not None else time.time()) // step)
+    digest = hmac.new(key, struct.pack('>Q', counter), hashlib.sha1).digest()
+    offset = digest[-1] & 0x0F
+    code = (struct.unpack('>I', digest[offset:offset + 4])[0] & 0x7FFFFFFF) % (10 ** digits)
+    return str(code).zfill(digits)
+
+
+class AdminTokenProvider:
+    """Hands out a valid admin JWT, refreshing it from the configured sources when needed"""
+
+    def __init__(self, api_url=None, token_file=None, env=None, session=None):
+        self.env = os.environ if env is None else env
+        self.api_url = (api_url or self.env.get('ADMIN_API_URL') or DEFAULT_API_URL).rstrip('/')
+        self.token_file = token_file or self.env.get('ADMIN_TOKEN_FILE') or DEFAULT_TOKEN_FILE
+        self.session = session or requests
+        self._token = None
+
+    def get_token(self, force_refresh=False):
+        """A fresh token; force_refresh skips cached tokens (e.g. after a 401)"""
+        if not force_refresh and token_is_fresh(self._token):
+            return self._token
+
+        candidates = [] if force_refresh else [self.env.get('ADMIN_TOKEN'), self._read_token_file()]
+        for token in candidates:
+            if token_is_fresh(token):
+                self._token = token
+                return token
+
+        self._token = self._login()
+        self._write_token_file(self._token)
+        return self._token
+
+    def use_token(self, token):
+        """Use a token obtained some other way (e.g. pasted by the operator) for this process"""
+        self._token = token
+
+    def invalidate(self):
+        """Forget the current token, e.g. after the server rejected it"""
+        self._token = None
+        try:
+            os.remove(self.token_file)
+        except OSError:
+            pass
+
+    def auth_headers(self, force_refresh=False):
+        return {"Authorization": f"Bearer {self.get_token(force_refresh)}"}
+
+    def _read_token_file(self):
+        try:
+            with open(self.token_file, 'r', encoding='utf-8') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _write_token_file(self, token):
+        atomic_write(self.token_file, token, mode=0o600)
+
+    def _post(self, path, payload):
+        try:
+            response = self.session.post(f"{self.api_url}{path}", json=payload, timeout=LOGIN_TIMEOUT)
+        except requests.RequestException as e:
+            raise AdminAuthError(f"Could not reach {self.api_url}: {e}")
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        if response.status_code != 200:
+            raise AdminAuthError(f"{path} returned {response.status_code}: {data.get('error', response.text[:200])}")
+        return data
+
+    def _login(self):
+        email = self.env.get('ADMIN_EMAIL')
+        password = self.env.get('ADMIN_PASSWORD')
+        if not email or not password:
+            raise AdminAuthError("No valid admin token: set ADMIN_TOKEN, or ADMIN_EMAIL and ADMIN_PASSWORD to log in")
+
+        data = self._post('/api/admin/login', {'email': email, 'password': password})
+        if data.get('totpRequired'):
+            code = self.env.get('ADMIN_TOTP_CODE')
+            if not code and self.env.get('ADMIN_TOTP_SECRET'):
+                code = totp_code(self.env['ADMIN_TOTP_SECRET'])
+            if not code:
+                raise AdminAuthError("Admin login requires TOTP: set ADMIN_TOTP_SECRET (or ADMIN_TOTP_CODE)")
+            data = self._post('/api/admin/totp/verify-login', {'email': email, 'password': password, 'code': code})
+
+        token = data.get('token')
+        if not token:
+            raise AdminAuthError("Login response did not include a token")
+        print("🔑 Logged in to the admin API", file=sys.stderr)
+        return token
+
+
+def main():
+    try:
+        print(AdminTokenProvider().get_token())
+    except AdminAuthError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
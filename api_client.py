@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for the Python tooling (admin API calls and the Etsy scrapers).
+RetryingSession is a requests.Session with a keep-alive connection pool, a timeout on
+every request, retries with jittered exponential backoff on connection errors and 5xx
+responses (idempotent methods only), and per-request latency logging/statistics.
+AdminApiClient adds admin authentication on top (see admin_credentials.py).
+
+Latency of every request is logged at DEBUG on the "plwg.http" logger; set
+HTTP_LOG_LEVEL=DEBUG to see it.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from admin_credentials import AdminAuthError, AdminTokenProvider
+
+# AdminAuthError is re-exported: AdminApiClient raises it and callers catch it from here
+__all__ = [
+    'AdminApiClient', 'AdminAuthError', 'ApiError', 'RetryingSession', 'backoff_delay', 'create_session',
+]
+
+# (connect, read) seconds, used when a call does not pass its own timeout
+DEFAULT_TIMEOUT = (5, 30)
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 8.0
+DEFAULT_POOL_SIZE = 10
+DEFAULT_PAGE_SIZE = 200
+
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+logger = logging.getLogger('plwg.http')
+if os.environ.get('HTTP_LOG_LEVEL'):
+    logging.basicConfig(format='%(asctime)s %(name)s %(message)s')
+    logger.setLevel(os.environ['HTTP_LOG_LEVEL'].upper())
+
+
+class ApiError(Exception):
+    """Raised when the admin API answers with an error status"""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def backoff_delay(attempt, backoff=DEFAULT_BACKOFF, max_backoff=MAX_BACKOFF):
+    """Full-jitter exponential backoff: uniform(0, min(max, backoff * 2**attempt))"""
+    return random.uniform(0, min(max_backoff, backoff * (2 ** attempt)))
+
+
+class RetryingSession(requests.Session):
+    """requests.Session with default timeouts, retries with jittered backoff and latency stats"""
+
+    def __init__(self, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, max_backoff=MAX_BACKOFF,
+                 timeout=DEFAULT_TIMEOUT):
+        super().__init__()
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.request_count = 0
+        self.retry_count = 0
+        self.latencies = []
+        self._stats_lock = threading.Lock()
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        retryable = method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except RETRY_EXCEPTIONS as e:
+                self._record(method, url, start, type(e).__name__, attempt)
+                if not retryable or attempt >= self.retries:
+                    raise
+            else:
+                self._record(method, url, start, response.status_code, attempt)
+                if response.status_code not in RETRY_STATUSES or not retryable or attempt >= self.retries:
+                    return response
+                response.close()
+
+            delay = backoff_delay(attempt, self.backoff, self.max_backoff)
+            attempt += 1
+            with self._stats_lock:
+                self.retry_count += 1
+            logger.info("retry %d/%d for %s %s in %.2fs", attempt, self.retries, method, url, delay)
+            time.sleep(delay)
+
+    def _record(self, method, url, start, outcome, attempt):
+        elapsed = time.perf_counter() - start
+        with self._stats_lock:
+            self.request_count += 1
+            self.latencies.append(elapsed)
+        logger.debug("%s %s -> %s in %.1f ms (attempt %d)", method, url, outcome, elapsed * 1000, attempt + 1)
+
+    def summary(self):
+        """One-line request/latency summary for the end of a run"""
+        if not self.latencies:
+            return "no HTTP requests"
+        latencies = sorted(self.latencies)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        average = sum(latencies) / len(latencies)
+        return (f"{self.request_count} requests, {self.retry_count} retries, "
+                f"avg {average * 1000:.0f} ms, p95 {p95 * 1000:.0f} ms")
+
+
+def create_session(headers=None, pool_size=DEFAULT_POOL_SIZE, **options):
+    """Create a keep-alive RetryingSession whose connection pool fits the worker count"""
+    session = RetryingSession(**options)
+    if headers:
+        session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class AdminApiClient:
+    """Authenticated client for the server's /api/admin endpoints"""
+
+    def __init__(self, token_provider=None, session=None):
+        self.session = session or create_session({"Content-Type": "application/json"})
+        self.token_provider = token_provider or AdminTokenProvider(session=self.session)
+        self.api_url = self.token_provider.api_url
+
+    def get(self, path, params=None):
+        """GET an admin endpoint, logging in again once if the server rejects the cached token"""
+        url = f"{self.api_url}{path}"
+        response = self.session.get(url, params=params, headers=self.token_provider.auth_headers())
+        if response.status_code in (401, 403):
+            self.token_provider.invalidate()
+            response = self.session.get(url, params=params,
+                                        headers=self.token_provider.auth_headers(force_refresh=True))
+        if response.status_code != 200:
+            raise ApiError(f"GET {path} returned {response.status_code}: {response.text[:200]}",
+                           response.status_code)
+        return response
+
+    def get_json(self, path, params=None):
+        return self.get(path, params).json()
+
+    def get_products(self):
+        """Every active product, as returned by GET /api/admin/products"""
+        return self.get_json('/api/admin/products')
+
+    def iter_products(self, fields=None, page_size=DEFAULT_PAGE_SIZE, updated_after=None):
+        """
+        Yield active products in id order, one keyset-paginated page at a time, so memory
+        does not grow with the catalog. fields limits the columns fetched (id is always
+        included); updated_after (an ISO timestamp) limits them to products whose
+        updated_at is at or after it. Raises ApiError if the server answers with a bare list
+        instead of a page: that is the full unpaged response (or the single mock product
+        served while the database is down), never a catalog to reconcile pages against.
+        """
+        params = {'limit': page_size, 'after_id': 0}
+        if fields:
+            params['fields'] = ','.join(fields)
+        if updated_after:
+            params['updated_after'] = updated_after
+        while True:
+            data = self.get_json('/api/admin/products', params)
+            if not isinstance(data, dict) or 'products' not in data:
+                raise ApiError("GET /api/admin/products ignored the paging parameters; "
+                               "refusing to treat its response as the full product list")
+            yield from data['products']
+            if data.get('next_after_id') is None:
+                return
+            params['after_id'] = data['next_after_id']
+
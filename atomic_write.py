@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Crash-safe file writes for everything the tooling generates.
+atomic_write() writes into a temp file in the target's directory, fsyncs it and renames
+it over the target, so a reader (e.g. server.js streaming a page) sees either the old
+file or the new one, never a truncated mix, and a crash leaves the old file intact.
+
+DirectoryLock is an advisory lock on a directory (a .lock file inside it, fcntl.flock on
+POSIX, msvcrt.locking on Windows) for read-merge-write updates of shared state such as
+the edit page manifest, so parallel runs do not lose each other's entries.
+"""
+
+import json
+import os
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+LOCK_NAME = ".lock"
+DEFAULT_FILE_MODE = 0o644
+
+
+class LockTimeout(Exception):
+    """Raised when a DirectoryLock cannot be acquired within its timeout"""
+
+
+def _fsync_directory(directory):
+    # Makes the rename itself durable; not possible (or needed) on Windows
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, data, mode=None, fsync=True, buffer_size=-1):
+    """
+    Replace path with data (str is written as UTF-8) atomically.
+    The file keeps the permissions of the file it replaces, else gets mode (default 0644).
+    fsync=False skips the flushes to disk: still atomic for readers, but not crash-durable.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    if mode is None:
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = DEFAULT_FILE_MODE
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=buffer_size) as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    if fsync:
+        _fsync_directory(directory)
+
+
+def atomic_write_json(path, obj, mode=None, fsync=True, **dump_options):
+    """atomic_write of json.dumps(obj); dump_options default to indent=2, sort_keys=True"""
+    dump_options.setdefault('indent', 2)
+    dump_options.setdefault('sort_keys', True)
+    atomic_write(path, json.dumps(obj, **dump_options), mode=mode, fsync=fsync)
+
+
+class DirectoryLock:
+    """
+    Exclusive advisory lock on a directory, used as a context manager:
+        with DirectoryLock("pages"):
+            ...read, merge and atomically rewrite the manifest...
+    timeout=None waits indefinitely. Where neither fcntl nor msvcrt exists it does nothing.
+    """
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, directory, timeout=None, name=LOCK_NAME):
+        self.path = os.path.join(directory, name)
+        self.timeout = timeout
+        self._fd = None
+
+    def acquire(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            try:
+                self._lock()
+                return self
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(self._fd)
+                    self._fd = None
+                    raise LockTimeout(f"Could not lock {self.path} within {self.timeout}s")
+                time.sleep(self.POLL_INTERVAL)
+
+    def _lock(self):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            msvcrt.locking(self._fd, msvcrt.LK_NBLCK, 1)
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc_info):
+        self.release()
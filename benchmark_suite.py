@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Performance baseline for the Python catalog and page tooling.
+Every case runs on synthetic catalogs (100, 1,000 and 10,000 products by default), each
+in a fresh process so its peak RSS is its own, and records wall time, peak RSS and bytes
+written. Results are appended to benchmark_history.json and compared with the previous
+run, so a regression between releases shows up as a flagged slowdown.
+
+Cases:
+    parse_shop_html           add_all_products.iter_products_from_html on a synthetic shop.html
+    render:<module>           each edit page renderer, rendered and written through the engine
+    size_chart_patcher        size_chart_patcher.patch_file over the catalog's edit pages
+    rewrite:<module>          the page_patch currency and Tailwind CDN rules
+
+    python benchmark_suite.py                          # everything, recorded in the history
+    python benchmark_suite.py --sizes 100,1000 --cases render --no-record
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from atomic_write import atomic_write_json
+
+HISTORY_PATH = "benchmark_history.json"
+DEFAULT_SIZES = (100, 1000, 10000)
+# A case this much slower than in the previous run is flagged
+REGRESSION_THRESHOLD = 0.20
+
+REWRITE_MODULES = ('revert_currency_to_usd', 'fix_tailwind_cdn_in_all_edit_pages')
+# Injected into the synthetic pages so the rewrite rules have something to replace
+REWRITE_TARGETS = ('<script src="https://cdn.tailwindcss.com"></script>\n'
+                   '<span class="price">$434.78 MXN</span> <span class="price">$671.94 MXN</span>\n')
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KB (None where resource is unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def edit_page_templates():
+    """Real edit pages to build the patcher catalogs from (they carry the patchers' anchors)"""
+    templates = sorted(glob.glob(os.path.join("pages", "product-edit-product-*.html")))
+    return templates or [os.path.join("pages", "product-edit.html")]
+
+
+def write_page_catalog(directory, size, extra=''):
+    """Write `size` edit pages cycled from the real templates; returns their paths"""
+    contents = []
+    for template in edit_page_templates():
+        with open(template, 'r', encoding='utf-8') as f:
+            contents.append(f.read())
+    paths = []
+    for i in range(1, size + 1):
+        path = os.path.join(directory, f"product-edit-product-{i}_benchmark_product.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(contents[i % len(contents)].replace('</body>', f'{extra}<!-- {i} --></body>', 1))
+        paths.append(path)
+    return paths
+
+
+def changed_bytes(paths, before):
+    """Bytes of the files whose mtime moved since `before` (a path -> mtime_ns map)"""
+    total = 0
+    for path in paths:
+        stat = os.stat(path)
+        if stat.st_mtime_ns != before[path]:
+            total += stat.st_size
+    return total
+
+
+def _case_parse_shop_html(directory, size):
+    from add_all_products import iter_products_from_html
+    from shop_products_parser import write_synthetic_shop_html
+    path = os.path.join(directory, 'shop.html')
+    write_synthetic_shop_html(path, size)
+
+    start = time.perf_counter()
+    items = sum(1 for _ in iter_products_from_html(path))
+    return time.perf_counter() - start, items, 0
+
+
+def _case_render(directory, size, module_name):
+    from edit_page_engine import BufferedPageWriter, render_edit_pages
+    from edit_page_template import BENCHMARK_RENDERERS, sample_products
+    func_name, make_args = next((func_name, make_args) for module, func_name, make_args in BENCHMARK_RENDERERS
+                                if module == module_name)
+    render = getattr(importlib.import_module(module_name), func_name)
+    products = sample_products(size)
+    pages_dir = os.path.join(directory, 'pages')
+    # No fsync: measure the tooling, not the disk
+    writer = BufferedPageWriter(pages_dir, fsync=False)
+
+    start = time.perf_counter()
+    jobs = ((f"product-edit-product-{p['id']}_benchmark_product.html", render, make_args(p)) for p in products)
+    items = sum(1 for _, written, error in render_edit_pages(jobs, workers=1, writer=writer) if not error)
+    elapsed = time.perf_counter() - start
+    return elapsed, items, sum(entry['size'] for entry in writer.index.pages.values())
+
+
+def _case_size_chart_patcher(directory, size):
+    from size_chart_patcher import patch_file
+    paths = write_page_catalog(directory, size)
+    before = {path: os.stat(path).st_mtime_ns for path in paths}
+
+    start = time.perf_counter()
+    items = sum(1 for path in paths if patch_file(path)[1])
+    elapsed = time.perf_counter() - start
+    return elapsed, items, changed_bytes(paths, before)
+
+
+def _case_rewrite(directory, size, module_name):
+    from page_patch import PatchRule, apply_rules
+    rules = [PatchRule(rule.name, os.path.join(directory, '*.html'), rule.match, rule.replacement, rule.regex)
+             for rule in importlib.import_module(module_name).RULES]
+    paths = write_page_catalog(directory, size, extra=REWRITE_TARGETS)
+    before = {path: os.stat(path).st_mtime_ns for path in paths}
+
+    start = time.perf_counter()
+    items = sum(1 for _ in apply_rules(rules, paths, workers=1))
+    elapsed = time.perf_counter() - start
+    return elapsed, items, changed_bytes(paths, before)
+
+
+def case_names():
+    from edit_page_template import BENCHMARK_RENDERERS
+    return (['parse_shop_html']
+            + [f"render:{module}" for module, _, _ in BENCHMARK_RENDERERS]
+            + ['size_chart_patcher']
+            + [f"rewrite:{module}" for module in REWRITE_MODULES])
+
+
+def run_case(name, size):
+    """Worker (a fresh process per case): run one case, returning its measurements"""
+    kind, _, module_name = name.partition(':')
+    case = {'parse_shop_html': _case_parse_shop_html, 'render': _case_render,
+            'size_chart_patcher': _case_size_chart_patcher, 'rewrite': _case_rewrite}[kind]
+    with tempfile.TemporaryDirectory(prefix='plwg-bench-') as directory:
+        try:
+            elapsed, items, written = case(directory, size, module_name) if module_name else case(directory, size)
+        except ImportError as e:
+            return {'case': name, 'size': size, 'error': f"{type(e).__name__}: {e}"}
+    return {'case': name, 'size': size, 'seconds': round(elapsed, 4), 'items': items,
+            'per_item_ms': round(elapsed * 1000 / size, 4), 'bytes_written': written,
+            'peak_rss_kb': peak_rss_kb()}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'runs': []}
+
+
+def previous_results(history):
+    """(case, size) -> result from the most recent recorded run"""
+    if not history['runs']:
+        return {}
+    return {(result['case'], result['size']): result for result in history['runs'][-1]['results']}
+
+
+def format_change(result, previous):
+    old = previous.get((result['case'], result['size']))
+    if not old or not old.get('seconds') or 'seconds' not in result:
+        return ''
+    change = result['seconds'] / old['seconds'] - 1
+    flag = '  ⚠️  regression' if change > REGRESSION_THRESHOLD else ''
+    return f"{change:+7.1%}{flag}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the catalog and page tooling on synthetic catalogs")
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help="comma-separated catalog sizes (default: %(default)s)")
+    parser.add_argument('--cases', default='', help="only run cases whose name contains this text")
+    parser.add_argument('--history', default=HISTORY_PATH, help="JSON history file (default: %(default)s)")
+    parser.add_argument('--no-record', action='store_true', help="do not append this run to the history")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    names = [name for name in case_names() if args.cases in name]
+    history = load_history(args.history)
+    previous = previous_results(history)
+
+    print(f"⏱️  {len(names)} cases x {len(sizes)} catalog sizes (previous run: "
+          f"{history['runs'][-1]['commit'] if history['runs'] else 'none'})")
+    print(f"  {'case':<55} {'size':>6} {'seconds':>9} {'ms/item':>8} {'peak RSS':>10} {'written':>11}  vs previous")
+    results = []
+    context = get_context('spawn')
+    for name in names:
+        for size in sizes:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_case, name, size).result()
+            results.append(result)
+            if 'error' in result:
+                print(f"  {name:<55} {size:>6}  ⚠️  skipped: {result['error']}")
+                continue
+            rss = f"{result['peak_rss_kb'] / 1024:.0f} MB" if result['peak_rss_kb'] else 'n/a'
+            print(f"  {name:<55} {size:>6} {result['seconds']:>9.3f} {result['per_item_ms']:>8.3f} {rss:>10} "
+                  f"{result['bytes_written'] / 1e6:>8.1f} MB  {format_change(result, previous)}")
+
+    if args.no_record:
+        return
+    history['runs'].append({
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'results': results,
+    })
+    atomic_write_json(args.history, history)
+    print(f"\n📝 Recorded in {args.history} ({len(history['runs'])} runs)")
+
+
+if __name__ == "__main__":
+    main()
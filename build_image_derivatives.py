@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Build resized WebP (and AVIF, when a codec is available) derivatives of the images in etsy_images/.
+Produces the same sizes tools/static_product_builder.js asks Cloudinary for (800x800 main
+images, 300x120 sub images) plus thumbnails, so pages can be served without a CDN round trip.
+
+Work is fanned out across a process pool, one source image per task. Outputs are named by
+source hash + transform parameters, so unchanged sources are skipped on the next run.
+"""
+
+import argparse
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+
+from atomic_write import atomic_write_json
+
+try:
+    import pillow_avif  # noqa: F401  (registers the AVIF plugin on older Pillow releases)
+except ImportError:
+    pass
+
+SOURCE_FOLDER = "etsy_images"
+OUTPUT_FOLDER = os.path.join(SOURCE_FOLDER, "derivatives")
+MANIFEST_NAME = "manifest.json"
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+# Matches buildImageUrl(url, w, h) in tools/static_product_builder.js (c_fill, g_auto)
+TRANSFORMS = {
+    'main': (800, 800),
+    'sub': (300, 120),
+    'thumb': (150, 150),
+}
+DEFAULT_QUALITY = 80
+
+
+def avif_supported():
+    """True when Pillow can encode AVIF in this environment"""
+    Image.init()
+    return 'AVIF' in Image.SAVE
+
+
+def file_hash(path):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def derivative_path(output_folder, source_hash, width, height, fmt, quality):
+    """Cache key on disk: source hash plus every transform parameter"""
+    name = f"{source_hash[:16]}_{width}x{height}_q{quality}.{fmt}"
+    return os.path.join(output_folder, source_hash[:2], name)
+
+
+def find_sources(source_folder, output_folder):
+    """Every image under source_folder, skipping the derivatives themselves"""
+    sources = []
+    output_root = os.path.abspath(output_folder)
+    for root, dirs, files in os.walk(source_folder):
+        dirs[:] = [d for d in dirs if os.path.abspath(os.path.join(root, d)) != output_root]
+        for filename in sorted(files):
+            if filename.lower().endswith(SOURCE_EXTENSIONS) and not filename.startswith('.'):
+                sources.append(os.path.join(root, filename))
+    return sorted(sources)
+
+
+def build_derivatives(source_path, output_folder, formats, quality):
+    """
+    Worker: hash one source and write any of its derivatives that are missing.
+    Returns (source_path, source_hash, {transform: {format: path}}, created_count).
+    """
+    source_hash = file_hash(source_path)
+    variants = {}
+    todo = []
+    for name, (width, height) in TRANSFORMS.items():
+        variants[name] = {}
+        for fmt in formats:
+            path = derivative_path(output_folder, source_hash, width, height, fmt, quality)
+            variants[name][fmt] = path
+            if not os.path.exists(path):
+                todo.append((width, height, fmt, path))
+
+    if todo:
+        with Image.open(source_path) as img:
+            img = ImageOps.exif_transpose(img)
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+            for width, height, fmt, path in todo:
+                resized = ImageOps.fit(img, (width, height), Image.LANCZOS, centering=(0.5, 0.5))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Per-process temp name: identical sources can race for the same output
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                resized.save(tmp_path, format=fmt.upper(), quality=quality)
+                os.replace(tmp_path, path)
+
+    return source_path, source_hash, variants, len(todo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build resized WebP/AVIF derivatives of downloaded images")
+    parser.add_argument('--source', default=SOURCE_FOLDER, help="folder to scan for images")
+    parser.add_argument('--output', default=OUTPUT_FOLDER, help="folder for derivatives and manifest")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="process pool size")
+    parser.add_argument('--quality', type=int, default=DEFAULT_QUALITY)
+    parser.add_argument('--no-avif', action='store_true', help="only build WebP even if AVIF is available")
+    args = parser.parse_args()
+
+    formats = ['webp']
+    if not args.no_avif and avif_supported():
+        formats.append('avif')
+    elif not args.no_avif:
+        print("AVIF encoder not available, building WebP only")
+
+    sources = find_sources(args.source, args.output)
+    print(f"🖼️  Building {', '.join(formats)} derivatives for {len(sources)} images with {args.workers} workers...")
+
+    manifest = {}
+    created = 0
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(build_derivatives, path, args.output, formats, args.quality)
+                   for path in sources]
+        for source_path, future in zip(sources, futures):
+            try:
+                _, source_hash, variants, created_count = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"❌ Error processing {source_path}: {e}")
+                continue
+            created += created_count
+            manifest[source_path.replace(os.sep, '/')] = {'hash': source_hash, 'variants': variants}
+            if created_count:
+                print(f"✅ {source_path}: {created_count} new derivatives")
+
+    os.makedirs(args.output, exist_ok=True)
+    manifest_path = os.path.join(args.output, MANIFEST_NAME)
+    atomic_write_json(manifest_path, {'transforms': TRANSFORMS, 'quality': args.quality, 'images': manifest})
+
+    cached = len(manifest) * len(TRANSFORMS) * len(formats) - created
+    print(f"🎉 Created {created} derivatives, {cached} already cached, {failed} failed")
+    print(f"📝 Manifest written to {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
+import argparse
 import requests
 import json
 import os
 import html
 
+from edit_page_engine import BufferedPageWriter, add_engine_arguments, render_edit_pages
+from edit_page_index import RETIRED_NOTICE
+
 def get_database_products():
     """Get products from the database API"""
     try:
@@ -523,6 +527,10 @@ def create_edit_page_content(product_id, product_name):
 </html>'''
 
 def main():
+    parser = argparse.ArgumentParser(description="Create edit pages for the actual database products")
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+
     print("🔍 Creating edit pages for actual database products...")
     
     # Get the actual product IDs from our database check
@@ -564,26 +572,30 @@ def main():
     
     pages_created = 0
     
+    writer = BufferedPageWriter()
+    if writer.index.retired:
+        print(RETIRED_NOTICE)
+        return
+    
+    jobs = []
     for product_id, product_name in actual_products:
-        try:
-            # Create filename
-            clean_name = product_name.lower().replace(' ', '_').replace('-', '_').replace('&', 'and').replace("'", '').replace('"', '').replace('(', '').replace(')', '').replace(',', '').replace('.', '').replace('!', '').replace('?', '').replace('/', '_').replace('\\', '_')[:50]
-            filename = f"pages/product-edit-product-{product_id}_{clean_name}.html"
-            
-            # Create content
-            content = create_edit_page_content(product_id, product_name)
-            
-            # Write file
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print(f"✅ Created: {filename}")
+        # Create filename
+        clean_name = product_name.lower().replace(' ', '_').replace('-', '_').replace('&', 'and').replace("'", '').replace('"', '').replace('(', '').replace(')', '').replace(',', '').replace('.', '').replace('!', '').replace('?', '').replace('/', '_').replace('\\', '_')[:50]
+        filename = f"product-edit-product-{product_id}_{clean_name}.html"
+        jobs.append((filename, create_edit_page_content, (product_id, product_name)))
+    
+    # Render in parallel and write each page
+    for filename, written, error in render_edit_pages(jobs, args.workers, compiled=args.compiled_template,
+                                                      writer=writer):
+        if error:
+            print(f"❌ Error creating page {filename}: {error}")
+        else:
             pages_created += 1
-            
-        except Exception as e:
-            print(f"❌ Error creating page for product {product_id}: {e}")
+            if written:
+                print(f"✅ Created: pages/{filename}")
     
     print(f"🎉 Successfully created {pages_created} edit pages!")
+    print(f"📊 Pages: {writer.summary()}")
     print("📝 Now all edit pages correspond to actual database products!")
 
 if __name__ == "__main__":
@@ -4,11 +4,15 @@ Script to create missing edit pages for products that don't have them.
 This will generate edit pages for any product ID that doesn't already have a corresponding edit page.
 """
 
-import os
+import argparse
 import re
 import json
 import requests
 
+from api_client import AdminApiClient, AdminAuthError, ApiError
+from edit_page_engine import BufferedPageWriter, add_engine_arguments, render_edit_pages
+from edit_page_index import RETIRED_NOTICE
+
 def clean_product_name(name):
     """Clean product name for use in filename"""
     if not name:
@@ -204,7 +208,7 @@ def create_edit_page_content(product_id, product_name, product_data):
                         <label for="product-category" class="form-label">Category</label>
                         <select id="product-category" class="form-input">
                             <option value="Halloween" {'selected' if category == 'Halloween' else ''}>Halloween</option>
-                            <option value="Father\'s Day" {'selected' if category == 'Father\'s Day' else ''}>Father's Day</option>
+                            <option value="Father\'s Day" {'selected' if category == "Father's Day" else ''}>Father's Day</option>
                             <option value="Birthday" {'selected' if category == 'Birthday' else ''}>Birthday</option>
                             <option value="Custom" {'selected' if category == 'Custom' else ''}>Custom</option>
                             <option value="Cancer Awareness" {'selected' if category == 'Cancer Awareness' else ''}>Cancer Awareness</option>
@@ -528,34 +532,20 @@ def create_edit_page_content(product_id, product_name, product_data):
     
     return html_content
 
-def get_existing_edit_pages():
-    """Get list of existing edit page filenames"""
-    pages_dir = "pages"
-    existing_pages = []
-    
-    if os.path.exists(pages_dir):
-        for filename in os.listdir(pages_dir):
-            if filename.startswith("product-edit-product-") and filename.endswith(".html"):
-                existing_pages.append(filename)
-    
-    return existing_pages
-
-def extract_product_id_from_filename(filename):
-    """Extract product ID from edit page filename"""
-    match = re.search(r'product-edit-product-(\d+)_', filename)
-    if match:
-        return int(match.group(1))
-    return None
+# Columns create_edit_page_content reads
+PAGE_FIELDS = [
+    'id', 'name', 'description', 'price', 'original_price', 'category', 'stock_quantity',
+    'low_stock_threshold', 'sale_percentage', 'tags', 'colors', 'sizes', 'specifications', 'features',
+]
 
 def get_database_products():
     """Get all products from the database via API"""
     try:
-        # Try to get products from the API
-        response = requests.get('http://localhost:3000/api/admin/products', timeout=5)
-        if response.status_code == 200:
-            return response.json()
-    except:
-        pass
+        # Try to get products from the API (see admin_credentials.py for authentication),
+        # paged and limited to the columns the edit page uses
+        return list(AdminApiClient().iter_products(fields=PAGE_FIELDS))
+    except (AdminAuthError, ApiError, requests.RequestException) as e:
+        print(f"⚠️  Could not fetch products from the API: {e}")
     
     # Fallback: return a list of product IDs that we know exist
     # This is based on the error you showed (product 433)
@@ -565,16 +555,18 @@ def get_database_products():
     ]
 
 def main():
+    parser = argparse.ArgumentParser(description="Create edit pages for products that don't have one")
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+
     print("🔍 Checking for missing edit pages...")
     
-    # Get existing edit pages
-    existing_pages = get_existing_edit_pages()
-    existing_ids = set()
-    
-    for page in existing_pages:
-        product_id = extract_product_id_from_filename(page)
-        if product_id:
-            existing_ids.add(product_id)
+    # Product ids that already have an edit page, from the edit page index
+    writer = BufferedPageWriter()
+    if writer.index.retired:
+        print(RETIRED_NOTICE)
+        return
+    existing_ids = writer.index.product_ids()
     
     print(f"✅ Found {len(existing_ids)} existing edit pages")
     
@@ -595,11 +587,7 @@ def main():
     print(f"🔧 Creating {len(missing_products)} missing edit pages...")
     
     # Create missing edit pages
-    pages_dir = "pages"
-    if not os.path.exists(pages_dir):
-        os.makedirs(pages_dir)
-    
-    created_count = 0
+    jobs = []
     for product in missing_products:
         product_id = product['id']
         product_name = product['name']
@@ -607,19 +595,20 @@ def main():
         # Clean name for filename
         clean_name = clean_product_name(product_name)
         filename = f"product-edit-product-{product_id:02d}_{clean_name}.html"
-        filepath = os.path.join(pages_dir, filename)
-        
-        # Create the edit page content
-        content = create_edit_page_content(product_id, product_name, product)
-        
-        # Write the file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+        jobs.append((filename, create_edit_page_content, (product_id, product_name, product), product_name))
+    
+    created_count = 0
+    for filename, written, error in render_edit_pages(jobs, args.workers, compiled=args.compiled_template,
+                                                      writer=writer):
+        if error:
+            print(f"❌ Error creating {filename}: {error}")
+            continue
         created_count += 1
-        print(f"✅ Created: {filename}")
+        if written:
+            print(f"✅ Created: {filename}")
     
     print(f"🎉 Successfully created {created_count} edit pages!")
+    print(f"📊 Pages: {writer.summary()}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,8 +1,13 @@
-import requests
-from bs4 import BeautifulSoup
 import os
 import re
 
+from api_client import create_session
+from etsy_downloader import guess_extension
+from etsy_html_extract import extract_assets
+from etsy_http_cache import HttpCache
+from etsy_image_variants import select_image_jobs
+from etsy_image_store import ImageStore, mime_from_response
+
 shop_url = "https://www.etsy.com/shop/PlwgsCreativeApparel"
 headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -10,18 +15,24 @@ headers = {
 output_folder = "etsy_images"
 
 os.makedirs(output_folder, exist_ok=True)
+store = ImageStore(output_folder)
+http_cache = HttpCache(output_folder)
+session = create_session(headers)
 
 print(f"Fetching images from: {shop_url}")
-html = requests.get(shop_url, headers=headers).text
-soup = BeautifulSoup(html, 'html.parser')
-
-images = soup.find_all('img')
-print(f"Found {len(images)} total images on the page")
+page_response, page_from_cache = http_cache.get(session, shop_url, keep_body=True)
+if page_from_cache:
+    print("Shop page not modified, using cached copy")
+    html = http_cache.cached_body(shop_url).decode('utf-8')
+else:
+    html = page_response.text
+assets = extract_assets(html)
+print(f"Found {assets.img_count} total images on the page")
 
 downloaded_count = 0
-for idx, img in enumerate(images):
-    src = img.get('src')
-    if src:
+skipped_count = 0
+for src, prefix in select_image_jobs(assets):
+    if prefix == 'image':
         # Check for various Etsy image patterns
         if any(pattern in src for pattern in ['il_', 'etsy', 'listing', 'shop', 'product']):
             try:
@@ -31,28 +42,33 @@ for idx, img in enumerate(images):
                 elif src.startswith('/'):
                     src = 'https://www.etsy.com' + src
                 
+                known = store.lookup(src) is not None
+                if known and not http_cache.has_validators(src):
+                    skipped_count += 1
+                    print(f"Already stored: {src}")
+                    continue
+                
                 print(f"Downloading: {src}")
-                response = requests.get(src, headers=headers, timeout=10)
+                response, from_cache = http_cache.get(session, src, conditional=known, timeout=10)
                 
-                if response.status_code == 200:
-                    # Determine file extension
-                    if 'jpg' in src.lower() or 'jpeg' in src.lower():
-                        ext = 'jpg'
-                    elif 'png' in src.lower():
-                        ext = 'png'
-                    elif 'webp' in src.lower():
-                        ext = 'webp'
-                    else:
-                        ext = 'jpg'
+                if from_cache:
+                    skipped_count += 1
+                    print(f"Not modified: {src}")
+                elif response.status_code == 200:
+                    ext = guess_extension(src)
                     
-                    filename = f"{output_folder}/etsy_image_{downloaded_count}.{ext}"
-                    with open(filename, 'wb') as f:
-                        f.write(response.content)
-                    downloaded_count += 1
-                    print(f"Saved: {filename}")
+                    entry, is_new = store.put(src, response.content, mime_from_response(response, src), 'image', ext)
+                    if is_new:
+                        downloaded_count += 1
+                        print(f"Saved: {entry['path']}")
+                    else:
+                        print(f"Duplicate of {entry['path']}, not saved again")
                 else:
                     print(f"Failed to download {src}: Status {response.status_code}")
             except Exception as e:
                 print(f"Error downloading {src}: {e}")
 
-print(f"\nDownload complete. Downloaded {downloaded_count} images to {output_folder}/") 
\ No newline at end of file
+store.save()
+http_cache.save()
+print(f"\nDownload complete. Downloaded {downloaded_count} new images to {output_folder}/ ({skipped_count} unchanged)")
+print(f"HTTP: {session.summary()}") 
\ No newline at end of file
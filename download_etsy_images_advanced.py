@@ -1,8 +1,16 @@
-import requests
-from bs4 import BeautifulSoup
+import argparse
 import os
-import json
-import time
+
+from etsy_downloader import (
+    ConcurrentImageFetcher,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RATE_LIMIT,
+    create_session,
+)
+from etsy_html_extract import extract_assets
+from etsy_image_variants import DEFAULT_TARGET_WIDTH, select_image_jobs
+from etsy_http_cache import HttpCache
+from etsy_image_store import ImageStore
 
 shop_url = "https://www.etsy.com/shop/PlwgsCreativeApparel"
 headers = {
@@ -15,112 +23,56 @@ headers = {
 }
 output_folder = "etsy_images"
 
+parser = argparse.ArgumentParser(description="Download all images from the Etsy shop page")
+parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                    help=f"number of parallel downloads (default: {DEFAULT_CONCURRENCY})")
+parser.add_argument('--rate-limit', type=float, default=DEFAULT_RATE_LIMIT,
+                    help=f"max requests per second per host, 0 disables (default: {DEFAULT_RATE_LIMIT})")
+parser.add_argument('--max-bytes', type=int, default=None,
+                    help="skip any single image larger than this many bytes (default: no cap)")
+parser.add_argument('--target-width', type=int, default=DEFAULT_TARGET_WIDTH,
+                    help=f"download one variant per photo, the smallest at least this wide (default: {DEFAULT_TARGET_WIDTH})")
+args = parser.parse_args()
+
 os.makedirs(output_folder, exist_ok=True)
 
 print(f"Fetching images from: {shop_url}")
 
 try:
-    response = requests.get(shop_url, headers=headers, timeout=15)
-    print(f"Response status: {response.status_code}")
-    
-    if response.status_code == 200:
-        html = response.text
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Find all images
-        images = soup.find_all('img')
-        print(f"Found {len(images)} total images on the page")
-        
-        # Also look for background images in CSS
-        style_tags = soup.find_all('style')
-        background_images = []
-        for style in style_tags:
-            if style.string:
-                # Extract background-image URLs
-                import re
-                bg_pattern = r'background-image:\s*url\(["\']?([^"\')\s]+)["\']?\)'
-                matches = re.findall(bg_pattern, style.string)
-                background_images.extend(matches)
-        
-        print(f"Found {len(background_images)} background images")
-        
-        downloaded_count = 0
-        
-        # Download regular images
-        for idx, img in enumerate(images):
-            src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-            if src:
-                try:
-                    # Handle relative URLs
-                    if src.startswith('//'):
-                        src = 'https:' + src
-                    elif src.startswith('/'):
-                        src = 'https://www.etsy.com' + src
-                    
-                    print(f"Attempting to download: {src}")
-                    img_response = requests.get(src, headers=headers, timeout=10)
-                    
-                    if img_response.status_code == 200:
-                        # Determine file extension
-                        if 'jpg' in src.lower() or 'jpeg' in src.lower():
-                            ext = 'jpg'
-                        elif 'png' in src.lower():
-                            ext = 'png'
-                        elif 'webp' in src.lower():
-                            ext = 'webp'
-                        else:
-                            ext = 'jpg'
-                        
-                        filename = f"{output_folder}/etsy_image_{downloaded_count}.{ext}"
-                        with open(filename, 'wb') as f:
-                            f.write(img_response.content)
-                        downloaded_count += 1
-                        print(f"✓ Saved: {filename}")
-                    else:
-                        print(f"✗ Failed to download {src}: Status {img_response.status_code}")
-                except Exception as e:
-                    print(f"✗ Error downloading {src}: {e}")
-        
-        # Download background images
-        for idx, bg_src in enumerate(background_images):
-            try:
-                if bg_src.startswith('//'):
-                    bg_src = 'https:' + bg_src
-                elif bg_src.startswith('/'):
-                    bg_src = 'https://www.etsy.com' + bg_src
-                
-                print(f"Attempting to download background: {bg_src}")
-                bg_response = requests.get(bg_src, headers=headers, timeout=10)
-                
-                if bg_response.status_code == 200:
-                    if 'jpg' in bg_src.lower() or 'jpeg' in bg_src.lower():
-                        ext = 'jpg'
-                    elif 'png' in bg_src.lower():
-                        ext = 'png'
-                    elif 'webp' in bg_src.lower():
-                        ext = 'webp'
-                    else:
-                        ext = 'jpg'
-                    
-                    filename = f"{output_folder}/etsy_bg_{downloaded_count}.{ext}"
-                    with open(filename, 'wb') as f:
-                        f.write(bg_response.content)
-                    downloaded_count += 1
-                    print(f"✓ Saved background: {filename}")
-                else:
-                    print(f"✗ Failed to download background {bg_src}: Status {bg_response.status_code}")
-            except Exception as e:
-                print(f"✗ Error downloading background {bg_src}: {e}")
-        
-        print(f"\nDownload complete. Downloaded {downloaded_count} images to {output_folder}/")
-        
+    session = create_session(headers, args.concurrency)
+    http_cache = HttpCache(output_folder)
+    response, from_cache = http_cache.get(session, shop_url, keep_body=True, timeout=15)
+    print(f"Response status: {response.status_code}{' (not modified, using cached page)' if from_cache else ''}")
+
+    if response.status_code in (200, 304):
+        html = http_cache.cached_body(shop_url).decode('utf-8') if from_cache else response.text
+        assets = extract_assets(html)
+        print(f"Found {assets.img_count} total images on the page")
+
+        # Regular images first, then background images, sharing one counter
+        jobs = select_image_jobs(assets, args.target_width)
+        background_count = sum(1 for _, prefix in jobs if prefix == 'bg')
+        print(f"Found {background_count} background images")
+
+        print(f"Downloading {len(jobs)} images with {args.concurrency} workers...")
+        fetcher = ConcurrentImageFetcher(ImageStore(output_folder), headers,
+                                         concurrency=args.concurrency,
+                                         rate_limit=args.rate_limit,
+                                         session=session,
+                                         http_cache=http_cache,
+                                         max_bytes=args.max_bytes)
+        downloaded_count = fetcher.download_all(jobs)
+
+        print(f"\nDownload complete. Downloaded {downloaded_count} new images to {output_folder}/")
+        print(f"HTTP: {session.summary()}")
+
         # Save the HTML for debugging
         with open(f"{output_folder}/page_source.html", 'w', encoding='utf-8') as f:
             f.write(html)
         print(f"Saved page source to {output_folder}/page_source.html for debugging")
-        
+
     else:
         print(f"Failed to fetch page. Status code: {response.status_code}")
-        
+
 except Exception as e:
-    print(f"Error fetching page: {e}") 
\ No newline at end of file
+    print(f"Error fetching page: {e}")
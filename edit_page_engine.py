@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Shared rendering engine for the product edit page generators.
+Pages are rendered in a process pool (each page is a large, CPU-bound f-string build)
+and written by the parent process through one buffered writer, so regenerating the whole
+catalog scales with the number of cores instead of running one page at a time.
+Pages whose content has not changed are not rewritten, which keeps their mtimes (and
+browser/CDN caches and git diffs) stable; content hashes live in the edit page index
+(see edit_page_index.py). Pages are replaced atomically (see atomic_write.py), so the
+server never streams a half-written page, and parallel runs merge their index updates
+under a directory lock.
+
+A job is (filename, render_function, args), optionally followed by the product name to
+record in the index. render_function must be a module-level
+function so it can be sent to worker processes. By default each renderer's f-string is
+compiled into pre-encoded static chunks (see edit_page_template.py); the output is identical.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from atomic_write import atomic_write
+from edit_page_index import EditPageIndex, edit_page_product_id
+from edit_page_template import CompiledRenderer
+
+PAGES_DIR = "pages"
+WRITE_BUFFER_SIZE = 256 * 1024
+# Pages are small, so hand each worker a batch at a time to keep IPC overhead low
+CHUNK_SIZE = 8
+# Jobs are pulled from the (possibly streaming) job iterable this many at a time
+BATCH_SIZE = 256
+
+
+def _render_job(job):
+    """Worker: render one page, returning (filename, encoded content, error message)"""
+    filename, render, args = job
+    try:
+        content = render(*args)
+        # Compiled templates already return bytes
+        if not isinstance(content, bytes):
+            content = content.encode('utf-8')
+        return filename, content, None
+    except Exception as e:
+        return filename, None, str(e)
+
+
+class BufferedPageWriter:
+    """
+    Writes rendered pages into the pages directory with a large write buffer, skipping
+    pages whose content is unchanged, and records every page in the edit page index.
+    A page whose size and mtime the index does not vouch for is compared against the
+    file on disk.
+    """
+
+    def __init__(self, pages_dir=PAGES_DIR, buffer_size=WRITE_BUFFER_SIZE, fsync=True):
+        self.pages_dir = pages_dir
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.written = 0
+        self.skipped = 0
+        self.removed = 0
+        self.index = EditPageIndex(pages_dir)
+
+    def save_index(self):
+        self.index.save()
+
+    def _is_unchanged(self, filepath, entry, digest, size):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        if stat.st_size != size:
+            return False
+        # Trust the index only while the file is exactly as this writer left it
+        if entry and entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == size:
+            return entry['hash'] == digest
+        with open(filepath, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest() == digest
+
+    def write(self, filename, content, name=None):
+        """Write a page unless it is unchanged; returns True if the file was written"""
+        filepath = os.path.join(self.pages_dir, filename)
+        digest = hashlib.sha256(content).hexdigest()
+        created = self.index.get(filename) is None and not os.path.exists(filepath)
+        unchanged = self._is_unchanged(filepath, self.index.get(filename), digest, len(content))
+        if not unchanged:
+            atomic_write(filepath, content, fsync=self.fsync, buffer_size=self.buffer_size)
+        self.index.record(filename, digest, len(content), os.stat(filepath).st_mtime_ns,
+                          name=name, generated=not unchanged)
+        if created:
+            self.remove_superseded(filename)
+        if unchanged:
+            self.skipped += 1
+        else:
+            self.written += 1
+        return not unchanged
+
+    def remove_superseded(self, filename):
+        """
+        After a page was created under a new name (the product was renamed, so its slug
+        changed), remove the pages generated earlier for the same product. Rewriting an
+        existing filename never removes anything: collapsing duplicates is left to
+        reconcile_edit_pages.py, which prefers the canonical name. Untracked files are left alone.
+        """
+        product_id = edit_page_product_id(filename)
+        if product_id is None:
+            return
+        for other in self.index.pages_for(product_id):
+            if other != filename and self.index.get(other).get('generated_at'):
+                self.remove(other)
+
+    def remove(self, filename):
+        """Delete a page and forget it; returns True if a file was removed"""
+        self.index.forget(filename)
+        try:
+            os.remove(os.path.join(self.pages_dir, filename))
+        except FileNotFoundError:
+            return False
+        self.removed += 1
+        return True
+
+    def summary(self):
+        return f"{self.written} written, {self.skipped} unchanged (skipped), {self.removed} removed"
+
+
+def _write_results(writer, results, names):
+    for filename, content, error in results:
+        written = False
+        if error is None:
+            try:
+                written = writer.write(filename, content, names.pop(filename, None))
+            except OSError as e:
+                error = str(e)
+        yield filename, written, error
+
+
+def _batches(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def render_edit_pages(jobs, workers=None, pages_dir=PAGES_DIR, compiled=True, writer=None):
+    """
+    Render and write every job. Yields (filename, written, error) in job order; written is
+    False when the page was already up to date and error is None on success.
+    jobs may be a generator: it is consumed BATCH_SIZE jobs at a time, so streamed products
+    are never all held in memory. workers=1 renders in-process without a pool.
+    compiled=False renders through the plain f-string functions. Pass a BufferedPageWriter
+    to read its counts afterwards.
+    """
+    if writer is None:
+        writer = BufferedPageWriter(pages_dir)
+    renderers = {}
+    names = {}
+    executor = None
+
+    try:
+        for batch in _batches(jobs, BATCH_SIZE):
+            for job in batch:
+                if len(job) > 3:
+                    names[job[0]] = job[3]
+            batch = [job[:3] for job in batch]
+            if compiled:
+                batch = [(filename, renderers.setdefault(render, CompiledRenderer(render)), args)
+                         for filename, render, args in batch]
+            if workers == 1 or (executor is None and len(batch) <= 1):
+                yield from _write_results(writer, map(_render_job, batch), names)
+                continue
+            if executor is None:
+                executor = ProcessPoolExecutor(max_workers=workers)
+            yield from _write_results(writer, executor.map(_render_job, batch, chunksize=CHUNK_SIZE), names)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        writer.save_index()
+
+
+def add_engine_arguments(parser):
+    """Add the shared --workers and --no-compiled-template options to a generator's parser"""
+    parser.add_argument('--workers', type=int, default=None,
+                        help="render processes (default: one per CPU; 1 renders serially)")
+    parser.add_argument('--no-compiled-template', dest='compiled_template', action='store_false',
+                        help="render with the plain f-string instead of the compiled template")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Persistent index of the product edit pages (.edit_pages_index.json beside pages/).
+Maps every product-edit-product-{id}_{slug}.html page to its product id, slug, product
+name, content hash and last generation time, with an in-memory id -> pages lookup, so the
+generators and reconciliation jobs never list and regex-parse the pages directory.
+
+The generators keep the index current through BufferedPageWriter. Pages created or
+deleted by something else (server.js, create_edit_page_for_product.js, by hand) are
+picked up by a single directory listing, done on load only when the directory's mtime
+no longer matches the one recorded when the index was saved, and once more under the
+lock when saving (the index lives outside the directory so that saving it does not move
+that mtime).
+
+Once migrate_to_dynamic_edit_page.py has run, `retired` is set: pages/product-edit.html
+serves every product and the tools no longer create per-product pages. Unlike the index
+(local mtimes and hashes, not committed), that decision is kept in the committed
+edit_pages_retired.json beside pages/, so every clone and deployed server.js sees it.
+
+    python edit_page_index.py            # summary, including ids with several pages
+    python edit_page_index.py --rebuild  # rescan and rehash every page
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timezone
+
+from atomic_write import DirectoryLock, atomic_write_json
+
+PAGES_DIR = "pages"
+INDEX_NAME = ".edit_pages_index.json"
+# Written by the engine before the index existed; migrated on first load
+LEGACY_MANIFEST_NAME = ".edit_pages_manifest.json"
+INDEX_VERSION = 1
+# Committed with the repository; server.js reads it too
+RETIRED_NAME = "edit_pages_retired.json"
+# Printed by the generators, which stop instead of writing pages once they are retired
+RETIRED_NOTICE = "✅ Per-product edit pages are retired: /product-edit.html?id=<id> edits every product"
+
+EDIT_PAGE_PATTERN = re.compile(r'^product-edit-product-(\d+)_(.*)\.html$')
+
+
+def parse_edit_page_filename(filename):
+    """(product id, slug) from a product-edit-product-{id}_{slug}.html filename, or None"""
+    match = EDIT_PAGE_PATTERN.match(filename)
+    return (int(match.group(1)), match.group(2)) if match else None
+
+
+def edit_page_product_id(filename):
+    """Product id from an edit page filename, or None"""
+    parsed = parse_edit_page_filename(filename)
+    return parsed[0] if parsed else None
+
+
+def name_from_slug(slug):
+    """Best-effort product name for pages the index has no name for"""
+    return slug.replace('_', ' ').title() if slug else "Unknown Product"
+
+
+def retired_path(pages_dir=PAGES_DIR):
+    return os.path.join(os.path.dirname(os.path.abspath(pages_dir)), RETIRED_NAME)
+
+
+def pages_retired(pages_dir=PAGES_DIR):
+    """True once the per-product edit pages were retired (see migrate_to_dynamic_edit_page.py)"""
+    try:
+        with open(retired_path(pages_dir), 'r', encoding='utf-8') as f:
+            return json.load(f).get('retired') is True
+    except (OSError, ValueError):
+        return False
+
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class EditPageIndex:
+    """
+    filename -> {id, slug, name, hash, size, mtime_ns, generated_at}, plus by_id
+    (product id -> set of filenames). Saving merges this instance's changes into the file
+    under the pages directory lock, so parallel runs keep each other's entries.
+    """
+
+    def __init__(self, pages_dir=PAGES_DIR):
+        self.pages_dir = pages_dir
+        self.path = os.path.join(os.path.dirname(os.path.abspath(pages_dir)), INDEX_NAME)
+        self.pages = {}
+        self.by_id = {}
+        self._updated = set()
+        self._dropped = set()
+        os.makedirs(pages_dir, exist_ok=True)
+
+        data = self._load()
+        self.retired = pages_retired(pages_dir)
+        if data.get('retired') and not self.retired:
+            # Retired before the flag moved out of the (uncommitted) index
+            self.retire()
+        for filename, entry in data.get('pages', {}).items():
+            self._put(filename, entry)
+        if data.get('dir_mtime_ns') != os.stat(pages_dir).st_mtime_ns:
+            self.refresh()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        # No index yet: start from the engine's old hash manifest
+        try:
+            with open(os.path.join(self.pages_dir, LEGACY_MANIFEST_NAME), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        return {'pages': {filename: self._entry(filename, **entry) for filename, entry in manifest.items()
+                          if parse_edit_page_filename(filename)}}
+
+    @staticmethod
+    def _entry(filename, hash=None, size=None, mtime_ns=None, name=None, generated_at=None):
+        product_id, slug = parse_edit_page_filename(filename)
+        return {'id': product_id, 'slug': slug, 'name': name, 'hash': hash, 'size': size,
+                'mtime_ns': mtime_ns, 'generated_at': generated_at}
+
+    def _put(self, filename, entry):
+        self.pages[filename] = entry
+        self.by_id.setdefault(entry['id'], set()).add(filename)
+
+    def refresh(self):
+        """
+        Reconcile with the directory in one listing: index pages that appeared since the
+        last save and drop entries whose file is gone. Returns (added, dropped) counts.
+        """
+        on_disk = {filename for filename in os.listdir(self.pages_dir) if parse_edit_page_filename(filename)}
+        added = dropped = 0
+        for filename in on_disk - self.pages.keys():
+            filepath = os.path.join(self.pages_dir, filename)
+            try:
+                stat = os.stat(filepath)
+                digest = file_hash(filepath)
+            except OSError:
+                continue
+            self._put(filename, self._entry(filename, digest, stat.st_size, stat.st_mtime_ns))
+            self._updated.add(filename)
+            added += 1
+        for filename in self.pages.keys() - on_disk:
+            self.forget(filename)
+            dropped += 1
+        return added, dropped
+
+    def rebuild(self):
+        """Rescan and rehash every page (names and generation times are kept)"""
+        previous = dict(self.pages)
+        for filename in previous:
+            self.forget(filename)
+        self.refresh()
+        for filename, entry in self.pages.items():
+            if filename in previous:
+                entry['name'] = previous[filename].get('name')
+                entry['generated_at'] = previous[filename].get('generated_at')
+
+    def record(self, filename, digest, size, mtime_ns, name=None, generated=True):
+        """Note a page the tooling just wrote (generated=False: checked, content unchanged)"""
+        entry = self.pages.get(filename) or self._entry(filename)
+        entry.update(hash=digest, size=size, mtime_ns=mtime_ns)
+        if name:
+            entry['name'] = name
+        if generated or not entry.get('generated_at'):
+            entry['generated_at'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        self._put(filename, entry)
+        self._updated.add(filename)
+        self._dropped.discard(filename)
+
+    def forget(self, filename):
+        entry = self.pages.pop(filename, None)
+        if entry:
+            self.by_id.get(entry['id'], set()).discard(filename)
+            if not self.by_id.get(entry['id']):
+                self.by_id.pop(entry['id'], None)
+        self._updated.discard(filename)
+        self._dropped.add(filename)
+
+    def retire(self):
+        """Record (in the committed edit_pages_retired.json) that per-product pages are retired"""
+        atomic_write_json(retired_path(self.pages_dir), {
+            'retired': True,
+            'retired_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'edit_page': '/product-edit.html?id=<id>',
+        })
+        self.retired = True
+
+    def get(self, filename):
+        return self.pages.get(filename)
+
+    def pages_for(self, product_id):
+        """Filenames of every page for a product id, sorted (more than one means duplicates)"""
+        return sorted(self.by_id.get(product_id, ()))
+
+    def product_ids(self):
+        return set(self.by_id)
+
+    def filenames(self):
+        return sorted(self.pages)
+
+    def duplicates(self):
+        """product id -> filenames, for ids with more than one page"""
+        return {product_id: sorted(filenames) for product_id, filenames in self.by_id.items()
+                if len(filenames) > 1}
+
+    def name_for(self, filename):
+        """The product name recorded at generation time, else one rebuilt from the slug"""
+        entry = self.pages.get(filename)
+        if entry and entry.get('name'):
+            return entry['name']
+        parsed = parse_edit_page_filename(filename)
+        return name_from_slug(parsed[1] if parsed else None)
+
+    def save(self):
+        """
+        Merge this index's changes into the file on disk and reconcile the result with the
+        directory. The directory mtime recorded is read before that listing, so a page
+        another process adds or deletes later still moves it and triggers a refresh on load.
+        """
+        with DirectoryLock(self.pages_dir):
+            try:
+                os.remove(os.path.join(self.pages_dir, LEGACY_MANIFEST_NAME))
+            except FileNotFoundError:
+                pass
+            dir_mtime_ns = os.stat(self.pages_dir).st_mtime_ns
+            on_disk = self._load()
+            merged = on_disk.get('pages', {})
+            for filename in self._dropped:
+                merged.pop(filename, None)
+            for filename in self._updated:
+                merged[filename] = self.pages[filename]
+            self.pages = {}
+            self.by_id = {}
+            for filename, entry in merged.items():
+                self._put(filename, entry)
+            # Pages server.js created or deleted while this index was loaded
+            self.refresh()
+            atomic_write_json(self.path, {'version': INDEX_VERSION, 'pages': self.pages,
+                                          'dir_mtime_ns': dir_mtime_ns})
+        self._updated.clear()
+        self._dropped.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show or rebuild the product edit page index")
+    parser.add_argument('--pages-dir', default=PAGES_DIR)
+    parser.add_argument('--rebuild', action='store_true', help="rescan and rehash every page")
+    args = parser.parse_args()
+
+    index = EditPageIndex(args.pages_dir)
+    if args.rebuild:
+        index.rebuild()
+    index.save()
+
+    duplicates = index.duplicates()
+    print(f"📇 {len(index.pages)} edit pages for {len(index.by_id)} products")
+    if index.retired:
+        print("   Per-product pages are retired: pages/product-edit.html serves every product")
+    for product_id, filenames in sorted(duplicates.items()):
+        print(f"  ⚠️  Product {product_id} has {len(filenames)} pages: {', '.join(filenames)}")
+
+
+if __name__ == "__main__":
+    main()
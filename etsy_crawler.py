@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Paginated Etsy shop crawler with resumable checkpoints.
+Follows the shop's pagination links and every listing detail page, downloading images
+from each page, and keeps its frontier (visited + pending URLs) in a checkpoint file so
+an interrupted crawl picks up where it stopped.
+
+Run against saved HTML instead of the network with --fixtures DIR, where DIR holds
+page_source.html (shop page 1), shop_page_N.html and listing_ID.html files.
+Live crawls can write those files with --save-pages.
+"""
+
+import argparse
+import json
+import os
+import re
+from urllib.parse import parse_qs, urljoin, urlparse
+
+from atomic_write import atomic_write, atomic_write_json
+from etsy_downloader import (
+    ConcurrentImageFetcher,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RATE_LIMIT,
+    HostRateLimiter,
+    create_session,
+)
+from etsy_html_extract import extract_assets
+from etsy_image_variants import DEFAULT_TARGET_WIDTH, select_image_jobs
+from etsy_http_cache import HttpCache
+from etsy_image_store import ImageStore
+
+SHOP_URL = "https://www.etsy.com/shop/PlwgsCreativeApparel"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+OUTPUT_FOLDER = "etsy_images"
+CHECKPOINT_NAME = "crawl_checkpoint.json"
+# A page that fails this many fetches (429s, 5xx, timeouts) is given up on
+MAX_ATTEMPTS = 3
+
+LISTING_PATTERN = re.compile(r'/listing/(\d+)')
+
+
+def shop_page_url(shop_url, page):
+    """Canonical URL for page N of the shop"""
+    return shop_url if page <= 1 else f"{shop_url}?page={page}"
+
+
+def listing_url(listing_id):
+    """Canonical URL for a listing detail page"""
+    return f"https://www.etsy.com/listing/{listing_id}"
+
+
+def classify_url(url, shop_url=SHOP_URL):
+    """Return ('shop', page_number), ('listing', listing_id) or (None, None)"""
+    parsed = urlparse(url)
+    listing = LISTING_PATTERN.search(parsed.path)
+    if listing:
+        return 'listing', listing.group(1)
+    if parsed.path.rstrip('/').lower() == urlparse(shop_url).path.rstrip('/').lower():
+        page = parse_qs(parsed.query).get('page', ['1'])[0]
+        return 'shop', int(page) if page.isdigit() else 1
+    return None, None
+
+
+def fixture_filename(url, shop_url=SHOP_URL):
+    """Name of the saved-HTML fixture for a URL"""
+    kind, value = classify_url(url, shop_url)
+    if kind == 'shop':
+        return 'page_source.html' if value == 1 else f'shop_page_{value}.html'
+    if kind == 'listing':
+        return f'listing_{value}.html'
+    return None
+
+
+def extract_links(assets, base_url, shop_url=SHOP_URL):
+    """Return canonical (shop page URLs, listing URLs) linked from a shop page"""
+    shop_pages = []
+    listings = []
+    for link in assets.links:
+        href = urljoin(base_url, link)
+        kind, value = classify_url(href, shop_url)
+        if kind == 'shop':
+            shop_pages.append(shop_page_url(shop_url, value))
+        elif kind == 'listing':
+            listings.append(listing_url(value))
+    return shop_pages, listings
+
+
+class Frontier:
+    """
+    Visited and pending URLs, persisted to a JSON checkpoint after every page.
+    A page whose fetch failed stays pending (moved to the back of the queue) until it
+    has failed max_attempts times, then it is recorded as failed.
+    """
+
+    def __init__(self, checkpoint_path, max_attempts=MAX_ATTEMPTS):
+        self.checkpoint_path = checkpoint_path
+        self.max_attempts = max_attempts
+        self.visited = set()
+        self.pending = []
+        self.queued = set()
+        self.attempts = {}
+        self.failed = set()
+
+    def load(self):
+        """Load an unfinished crawl; returns True when there is something to resume"""
+        if not os.path.exists(self.checkpoint_path):
+            return False
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not data.get('pending'):
+            return False
+        self.visited = set(data.get('visited', []))
+        self.pending = list(data['pending'])
+        self.attempts = dict(data.get('attempts', {}))
+        self.failed = set(data.get('failed', []))
+        self.queued = set(self.pending) | self.visited | self.failed
+        return True
+
+    def save(self):
+        """Write the frontier to the checkpoint file"""
+        data = {'visited': sorted(self.visited), 'pending': self.pending,
+                'attempts': self.attempts, 'failed': sorted(self.failed)}
+        atomic_write_json(self.checkpoint_path, data, sort_keys=False)
+
+    def add(self, url):
+        if url not in self.queued:
+            self.queued.add(url)
+            self.pending.append(url)
+
+    def pop(self):
+        return self.pending[0] if self.pending else None
+
+    def mark_visited(self, url):
+        self.pending.remove(url)
+        self.attempts.pop(url, None)
+        self.visited.add(url)
+
+    def mark_failed(self, url):
+        """Requeue a page whose fetch failed; returns False once it is given up on"""
+        self.pending.remove(url)
+        self.attempts[url] = self.attempts.get(url, 0) + 1
+        if self.attempts[url] >= self.max_attempts:
+            del self.attempts[url]
+            self.failed.add(url)
+            return False
+        self.pending.append(url)
+        return True
+
+
+class LiveFetcher:
+    """Fetches pages over HTTP through the revalidation cache"""
+
+    def __init__(self, session, http_cache, rate_limiter, save_dir=None, shop_url=SHOP_URL):
+        self.session = session
+        self.http_cache = http_cache
+        self.rate_limiter = rate_limiter
+        self.save_dir = save_dir
+        self.shop_url = shop_url
+
+    def __call__(self, url):
+        self.rate_limiter.wait(url)
+        response, from_cache = self.http_cache.get(self.session, url, keep_body=True, timeout=15)
+        if from_cache:
+            html = self.http_cache.cached_body(url).decode('utf-8')
+        elif response.status_code == 200:
+            html = response.text
+        else:
+            print(f"✗ Failed to fetch {url}: Status {response.status_code}")
+            return None
+
+        name = fixture_filename(url, self.shop_url)
+        if self.save_dir and name:
+            atomic_write(os.path.join(self.save_dir, name), html, fsync=False)
+        return html
+
+
+class FixtureFetcher:
+    """Serves pages from saved HTML files instead of the network"""
+
+    def __init__(self, fixture_dir, shop_url=SHOP_URL):
+        self.fixture_dir = fixture_dir
+        self.shop_url = shop_url
+
+    def __call__(self, url):
+        name = fixture_filename(url, self.shop_url)
+        path = os.path.join(self.fixture_dir, name) if name else None
+        if not path or not os.path.exists(path):
+            print(f"✗ No fixture for {url}")
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+
+def crawl(fetch_page, frontier, on_images=None, shop_url=SHOP_URL, max_pages=None,
+          target_width=DEFAULT_TARGET_WIDTH):
+    """
+    Crawl until the frontier is empty or max_pages pages were processed this run.
+    Shop pages contribute further shop pages and listings; listing pages only images.
+    Failed fetches count towards max_pages and are retried up to the frontier's max_attempts.
+    Returns (pages_crawled, images_found).
+    """
+    pages_crawled = 0
+    images_found = 0
+
+    while frontier.pending and (max_pages is None or pages_crawled < max_pages):
+        url = frontier.pop()
+        print(f"Crawling: {url}")
+        html = fetch_page(url)
+        pages_crawled += 1
+
+        if html is None:
+            # Keep the page (and so everything it links to) pending for a later attempt
+            if not frontier.mark_failed(url):
+                print(f"✗ Giving up on {url} after {frontier.max_attempts} failed attempts")
+            frontier.save()
+            continue
+
+        assets = extract_assets(html)
+        kind, _ = classify_url(url, shop_url)
+        if kind == 'shop':
+            shop_pages, listings = extract_links(assets, url, shop_url)
+            for link in shop_pages + listings:
+                frontier.add(link)
+
+        jobs = select_image_jobs(assets, target_width)
+        images_found += len(jobs)
+        if on_images and jobs:
+            on_images(jobs)
+
+        frontier.mark_visited(url)
+        frontier.save()
+
+    return pages_crawled, images_found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl every page of the Etsy shop and download its images")
+    parser.add_argument('--max-pages', type=int, default=None,
+                        help="stop after this many pages (the checkpoint keeps the rest)")
+    parser.add_argument('--checkpoint', default=os.path.join(OUTPUT_FOLDER, CHECKPOINT_NAME),
+                        help="frontier checkpoint file")
+    parser.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS,
+                        help="give up on a page after this many failed fetches")
+    parser.add_argument('--restart', action='store_true',
+                        help="ignore an existing checkpoint and start from page one")
+    parser.add_argument('--fixtures', metavar='DIR',
+                        help="crawl saved HTML files from DIR instead of the network (no image downloads)")
+    parser.add_argument('--save-pages', action='store_true',
+                        help="save every fetched page to etsy_images/ under its fixture name")
+    parser.add_argument('--target-width', type=int, default=DEFAULT_TARGET_WIDTH,
+                        help="download one variant per photo, the smallest at least this wide")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--rate-limit', type=float, default=DEFAULT_RATE_LIMIT)
+    args = parser.parse_args()
+
+    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+
+    frontier = Frontier(args.checkpoint, args.max_attempts)
+    if not args.restart and frontier.load():
+        print(f"Resuming crawl: {len(frontier.visited)} visited, {len(frontier.pending)} pending")
+    else:
+        frontier.add(SHOP_URL)
+
+    if args.fixtures:
+        fetch_page = FixtureFetcher(args.fixtures)
+        on_images = None
+    else:
+        session = create_session(HEADERS, args.concurrency)
+        http_cache = HttpCache(OUTPUT_FOLDER)
+        rate_limiter = HostRateLimiter(args.rate_limit)
+        fetch_page = LiveFetcher(session, http_cache, rate_limiter,
+                                 save_dir=OUTPUT_FOLDER if args.save_pages else None)
+        fetcher = ConcurrentImageFetcher(ImageStore(OUTPUT_FOLDER), HEADERS,
+                                         concurrency=args.concurrency,
+                                         rate_limit=args.rate_limit,
+                                         session=session,
+                                         http_cache=http_cache)
+        on_images = fetcher.download_all
+
+    pages_crawled, images_found = crawl(fetch_page, frontier, on_images, max_pages=args.max_pages,
+                                         target_width=args.target_width)
+
+    print(f"\nCrawled {pages_crawled} pages, found {images_found} image references")
+    if not args.fixtures:
+        print(f"HTTP: {session.summary()}")
+    if frontier.failed:
+        print(f"{len(frontier.failed)} pages failed {frontier.max_attempts} times and were skipped")
+    if frontier.pending:
+        print(f"{len(frontier.pending)} pages still pending; rerun to resume from {args.checkpoint}")
+    else:
+        print("Crawl complete.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Concurrent image download engine for the Etsy scrapers.
+Images are fetched on a bounded thread pool that shares one pooled, retrying HTTP
+session (see api_client.py), with a per-host rate limit so the Etsy CDN is not hammered.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import api_client
+from etsy_image_store import mime_from_response
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RATE_LIMIT = 5.0  # requests per second, per host
+DEFAULT_TIMEOUT = 10
+CHUNK_SIZE = 64 * 1024
+
+
+def create_session(headers, pool_size=DEFAULT_CONCURRENCY):
+    """Create a keep-alive, retrying session whose connection pool fits the worker count"""
+    return api_client.create_session(headers, pool_size)
+
+
+def normalize_url(src):
+    """Turn protocol-relative and root-relative Etsy URLs into absolute ones"""
+    if src.startswith('//'):
+        return 'https:' + src
+    if src.startswith('/'):
+        return 'https://www.etsy.com' + src
+    return src
+
+
+def guess_extension(url):
+    """Guess the file extension from the image URL's path, then from anywhere in the URL"""
+    path_ext = os.path.splitext(urlparse(url).path)[1].lower().lstrip('.')
+    if path_ext in ('jpg', 'jpeg', 'png', 'webp', 'gif', 'avif'):
+        return 'jpg' if path_ext == 'jpeg' else path_ext
+
+    lowered = url.lower()
+    if 'jpg' in lowered or 'jpeg' in lowered:
+        return 'jpg'
+    if 'png' in lowered:
+        return 'png'
+    if 'webp' in lowered:
+        return 'webp'
+    return 'jpg'
+
+
+class DownloadTooLarge(Exception):
+    """Raised when an image exceeds the configured max-bytes cap"""
+
+
+def stream_to_temp(response, directory, max_bytes=None, chunk_size=CHUNK_SIZE):
+    """
+    Write a streamed response body to a temp file in `directory`, chunk by chunk.
+    Returns (tmp_path, sha256 hex digest, size). Memory use stays at one chunk no matter
+    how large the image is; the temp file is removed again if anything goes wrong.
+    """
+    declared = response.headers.get('Content-Length')
+    if max_bytes and declared and declared.isdigit() and int(declared) > max_bytes:
+        raise DownloadTooLarge(f"Content-Length {declared} exceeds cap of {max_bytes} bytes")
+
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.part-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if max_bytes and size > max_bytes:
+                    raise DownloadTooLarge(f"body exceeds cap of {max_bytes} bytes")
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return tmp_path, digest.hexdigest(), size
+
+
+class HostRateLimiter:
+    """Spaces out requests so each host sees at most `rate` requests per second"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = {}
+
+    def wait(self, url):
+        if not self.interval:
+            return
+        host = urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ConcurrentImageFetcher:
+    """Download a batch of image URLs in parallel into an ImageStore"""
+
+    def __init__(self, store, headers, concurrency=DEFAULT_CONCURRENCY,
+                 rate_limit=DEFAULT_RATE_LIMIT, timeout=DEFAULT_TIMEOUT, session=None,
+                 http_cache=None, max_bytes=None):
+        self.store = store
+        self.http_cache = http_cache
+        self.max_bytes = max_bytes
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.session = session or create_session(headers, self.concurrency)
+        self.rate_limiter = HostRateLimiter(rate_limit)
+
+    def fetch(self, url, revalidate=False):
+        """
+        Stream a single URL into a temp file inside the store folder.
+        Returns (status_code, download, error) where download is a
+        (tmp_path, digest, size, mime) tuple for 200 responses and None otherwise.
+        """
+        self.rate_limiter.wait(url)
+        try:
+            if self.http_cache:
+                response, _ = self.http_cache.get(self.session, url, conditional=revalidate,
+                                                  timeout=self.timeout, stream=True)
+            else:
+                response = self.session.get(url, timeout=self.timeout, stream=True)
+            with response:
+                if response.status_code != 200:
+                    return response.status_code, None, None
+                tmp_path, digest, size = stream_to_temp(response, self.store.root, self.max_bytes)
+                return response.status_code, (tmp_path, digest, size, mime_from_response(response, url)), None
+        except Exception as e:
+            return None, None, e
+
+    def download_all(self, jobs):
+        """
+        Download (url, prefix) jobs concurrently.
+        URLs already in the store are skipped, or revalidated with a conditional request
+        when the HTTP cache has validators for them, and repeated URLs are fetched once.
+        Results are stored in job order, so new files get etsy_{prefix}_{N}.{ext} names
+        in the same order the sequential scraper used. Returns the number of new files.
+        """
+        pending = []
+        seen = set()
+        skipped = 0
+        for url, prefix in jobs:
+            if url in seen:
+                continue
+            seen.add(url)
+            known = self.store.lookup(url) is not None
+            revalidate = known and bool(self.http_cache) and self.http_cache.has_validators(url)
+            if known and not revalidate:
+                skipped += 1
+                continue
+            pending.append((url, prefix, revalidate))
+
+        saved = 0
+        duplicates = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [(url, prefix, executor.submit(self.fetch, url, revalidate))
+                       for url, prefix, revalidate in pending]
+
+            for url, prefix, future in futures:
+                label = 'background' if prefix == 'bg' else 'image'
+                status, download, error = future.result()
+
+                if error is not None:
+                    print(f"✗ Error downloading {label} {url}: {error}")
+                    continue
+                if status == 304:
+                    skipped += 1
+                    continue
+                if download is None:
+                    print(f"✗ Failed to download {label} {url}: Status {status}")
+                    continue
+
+                tmp_path, digest, size, mime = download
+                entry, is_new = self.store.put_file(url, tmp_path, digest, size, mime,
+                                                    prefix, guess_extension(url))
+                if is_new:
+                    saved += 1
+                    print(f"✓ Saved {label}: {entry['path']}")
+                else:
+                    duplicates += 1
+                    print(f"= Duplicate of {entry['path']}: {url}")
+
+        self.store.save()
+        if self.http_cache:
+            self.http_cache.save()
+        print(f"Skipped {skipped} unchanged URLs, {duplicates} duplicate downloads")
+        return saved
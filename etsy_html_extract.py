@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Parse-once HTML extraction for the Etsy scrapers.
+Walks the document a single time and pulls every image reference (src, data-src,
+data-lazy-src, srcset, CSS background URLs from <style> blocks and style attributes)
+plus the page's links. Uses selectolax or lxml when installed and falls back to the
+standard-library parser otherwise.
+
+Benchmark the backends against a saved page:
+    python etsy_html_extract.py --benchmark etsy_images/page_source.html
+"""
+
+import argparse
+import functools
+import re
+import time
+from collections import namedtuple
+from html.parser import HTMLParser
+
+from etsy_downloader import normalize_url
+
+IMAGE_ATTRIBUTES = ('src', 'data-src', 'data-lazy-src')
+SRCSET_ATTRIBUTES = ('srcset', 'data-srcset')
+BG_PATTERN = re.compile(r'background(?:-image)?\s*:[^;{}]*?url\(\s*["\']?([^"\')\s]+)["\']?\s*\)', re.IGNORECASE)
+
+# url: absolute URL; source: attribute it came from ('css' for backgrounds);
+# descriptor: srcset descriptor such as '794w' or None; element: index of the tag it
+# came from, so the variants of one <img> can be grouped (None for <style> blocks)
+ImageRef = namedtuple('ImageRef', 'url source descriptor element')
+
+
+class PageAssets:
+    """Everything the scrapers need from one page"""
+
+    def __init__(self):
+        self.images = []
+        self.links = []
+        self.img_count = 0
+        self._element = 0
+
+    def add_element(self, tag, attrs):
+        element = self._element
+        self._element += 1
+
+        if tag in ('img', 'source'):
+            if tag == 'img':
+                self.img_count += 1
+                for name in IMAGE_ATTRIBUTES:
+                    value = attrs.get(name)
+                    if value:
+                        self.images.append(ImageRef(normalize_url(value.strip()), name, None, element))
+            for name in SRCSET_ATTRIBUTES:
+                value = attrs.get(name)
+                if value:
+                    for url, descriptor in parse_srcset(value):
+                        self.images.append(ImageRef(normalize_url(url), 'srcset', descriptor, element))
+        elif tag == 'a':
+            href = attrs.get('href')
+            if href:
+                self.links.append(href)
+
+        style = attrs.get('style')
+        if style:
+            self.add_css(style, element)
+
+    def add_css(self, css, element=None):
+        for url in BG_PATTERN.findall(css):
+            self.images.append(ImageRef(normalize_url(url), 'css', None, element))
+
+
+def parse_srcset(value):
+    """Split a srcset attribute into (url, descriptor) pairs"""
+    candidates = []
+    for part in value.split(','):
+        pieces = part.strip().split()
+        if pieces:
+            candidates.append((pieces[0], pieces[1] if len(pieces) > 1 else None))
+    return candidates
+
+
+def _extract_selectolax(html):
+    from selectolax.parser import HTMLParser as SelectolaxParser
+    assets = PageAssets()
+    tree = SelectolaxParser(html)
+    # One selector query returns the matches in document order: a single walk
+    for node in tree.css('img, source, a, style, [style]'):
+        if node.tag == 'style':
+            assets.add_css(node.text(deep=True) or '')
+        assets.add_element(node.tag, {k: v for k, v in node.attributes.items() if v})
+    return assets
+
+
+def _extract_lxml(html):
+    import lxml.html
+    assets = PageAssets()
+    root = lxml.html.fromstring(html)
+    for el in root.iter():
+        if not isinstance(el.tag, str):
+            continue  # comments and processing instructions
+        if el.tag == 'style':
+            assets.add_css(el.text or '')
+        assets.add_element(el.tag, el.attrib)
+    return assets
+
+
+class _StdlibExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.assets = PageAssets()
+        self.in_style = False
+        self.style_text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'style':
+            self.in_style = True
+            self.style_text = []
+        self.assets.add_element(tag, {k: v for k, v in attrs if v})
+
+    def handle_startendtag(self, tag, attrs):
+        self.assets.add_element(tag, {k: v for k, v in attrs if v})
+
+    def handle_endtag(self, tag):
+        if tag == 'style' and self.in_style:
+            self.assets.add_css(''.join(self.style_text))
+            self.in_style = False
+
+    def handle_data(self, data):
+        if self.in_style:
+            self.style_text.append(data)
+
+
+def _extract_stdlib(html):
+    parser = _StdlibExtractor()
+    parser.feed(html)
+    parser.close()
+    return parser.assets
+
+
+BACKENDS = {
+    'selectolax': ('selectolax.parser', _extract_selectolax),
+    'lxml': ('lxml.html', _extract_lxml),
+    'stdlib': (None, _extract_stdlib),
+}
+BACKEND_ORDER = ('selectolax', 'lxml', 'stdlib')
+
+
+@functools.lru_cache(maxsize=None)
+def available_backends():
+    """Names of the backends importable in this environment, fastest first"""
+    names = []
+    for name in BACKEND_ORDER:
+        module, _ = BACKENDS[name]
+        if module is None:
+            names.append(name)
+            continue
+        try:
+            __import__(module)
+            names.append(name)
+        except ImportError:
+            pass
+    return tuple(names)
+
+
+def extract_assets(html, backend=None):
+    """Extract image references and links from a page with the given or fastest backend"""
+    name = backend or available_backends()[0]
+    _, extractor = BACKENDS[name]
+    return extractor(html)
+
+
+def _legacy_extract(html):
+    """The scrapers' original approach: BeautifulSoup, then a regex over each <style>"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    jobs = []
+    for img in soup.find_all('img'):
+        src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
+        if src:
+            jobs.append(src)
+    for style in soup.find_all('style'):
+        if style.string:
+            jobs.extend(re.findall(r'background-image:\s*url\(["\']?([^"\')\s]+)["\']?\)', style.string))
+    return jobs
+
+
+def benchmark(path, repeat):
+    with open(path, 'r', encoding='utf-8') as f:
+        html = f.read()
+    print(f"Benchmarking {path} ({len(html):,} bytes), best of {repeat} runs")
+
+    candidates = [(name, lambda name=name: extract_assets(html, name)) for name in available_backends()]
+    try:
+        import bs4  # noqa: F401
+        candidates.append(('bs4 + regex (legacy)', lambda: _legacy_extract(html)))
+    except ImportError:
+        pass
+
+    for name, run in candidates:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = run()
+            timings.append(time.perf_counter() - start)
+        found = len(result.images) if isinstance(result, PageAssets) else len(result)
+        print(f"  {name:<22} {min(timings) * 1000:8.2f} ms   {found} image refs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract image URLs from a saved page")
+    parser.add_argument('path', nargs='?', default='etsy_images/page_source.html')
+    parser.add_argument('--backend', choices=BACKEND_ORDER, default=None)
+    parser.add_argument('--benchmark', action='store_true', help="time every available backend")
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.path, args.repeat)
+        return
+
+    with open(args.path, 'r', encoding='utf-8') as f:
+        assets = extract_assets(f.read(), args.backend)
+    for ref in assets.images:
+        print(f"{ref.source:<14} {ref.descriptor or '':<6} {ref.url}")
+    print(f"{len(assets.images)} image refs, {len(assets.links)} links")
+
+
+if __name__ == "__main__":
+    main()
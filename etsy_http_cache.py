@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Persistent HTTP revalidation cache for the Etsy scrapers.
+Stores the ETag / Last-Modified validators for every URL we fetch and sends conditional
+requests on the next run, so unchanged pages and images come back as cheap 304 responses.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from atomic_write import atomic_write, atomic_write_json
+
+CACHE_NAME = "http_cache.json"
+BODY_DIR = "http_cache"
+
+
+class HttpCache:
+    """ETag / Last-Modified cache persisted next to the downloaded images"""
+
+    def __init__(self, root, cache_name=CACHE_NAME):
+        self.root = root
+        self.cache_path = os.path.join(root, cache_name)
+        self.body_dir = os.path.join(root, BODY_DIR)
+        self.entries = {}  # url -> {etag, last_modified, body}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self):
+        """Load cached validators from disk, if there are any"""
+        if not os.path.exists(self.cache_path):
+            return
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            self.entries = json.load(f).get('entries', {})
+
+    def save(self):
+        """Write cached validators back to disk"""
+        os.makedirs(self.root, exist_ok=True)
+        with self.lock:
+            data = {'version': 1, 'entries': dict(self.entries)}
+        atomic_write_json(self.cache_path, data)
+
+    def has_validators(self, url):
+        """True when a conditional request can be sent for this URL"""
+        entry = self.entries.get(url)
+        return bool(entry and (entry.get('etag') or entry.get('last_modified')))
+
+    def conditional_headers(self, url, need_body=False):
+        """Build If-None-Match / If-Modified-Since headers for a URL"""
+        entry = self.entries.get(url)
+        if not entry:
+            return {}
+        # A 304 is only useful to the caller if we can hand back the cached body
+        if need_body and not (entry.get('body') and os.path.exists(entry['body'])):
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def record(self, url, response, body=None):
+        """Remember the validators of a 200 response, and optionally its body"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            with self.lock:
+                self.entries.pop(url, None)
+            return
+
+        entry = {'etag': etag, 'last_modified': last_modified}
+        if body is not None:
+            os.makedirs(self.body_dir, exist_ok=True)
+            body_path = os.path.join(self.body_dir, hashlib.sha256(url.encode('utf-8')).hexdigest())
+            # Atomic, so a later 304 never hands back a half-written body
+            atomic_write(body_path, body)
+            entry['body'] = body_path
+        with self.lock:
+            self.entries[url] = entry
+
+    def cached_body(self, url):
+        """Return the body stored for a URL, or None"""
+        entry = self.entries.get(url)
+        if not entry or not entry.get('body') or not os.path.exists(entry['body']):
+            return None
+        with open(entry['body'], 'rb') as f:
+            return f.read()
+
+    def get(self, session, url, keep_body=False, conditional=True, headers=None, **kwargs):
+        """
+        Issue a conditional GET through `session` (a requests.Session or the requests module).
+        Returns (response, from_cache). from_cache is True on a 304, in which case the caller
+        should reuse what it already has; with keep_body=True that is cached_body(url).
+        Pass conditional=False when the caller no longer has its copy of the resource.
+        """
+        request_headers = dict(headers or {})
+        if conditional:
+            request_headers.update(self.conditional_headers(url, need_body=keep_body))
+        response = session.get(url, headers=request_headers, **kwargs)
+
+        if response.status_code == 304:
+            with self.lock:
+                self.hits += 1
+            return response, True
+
+        with self.lock:
+            self.misses += 1
+        if response.status_code == 200:
+            self.record(url, response, response.content if keep_body else None)
+        return response, False
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Content-addressed, deduplicating store for downloaded Etsy images.
+Every file is keyed by the SHA-256 of its bytes, and a manifest maps each source URL
+to its hash, file path, size and MIME type so reruns skip images we already have.
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+import tempfile
+
+from atomic_write import atomic_write_json
+
+MANIFEST_NAME = "manifest.json"
+
+
+def content_hash(content):
+    """Return the SHA-256 hex digest used as the store key"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def mime_from_response(response, url):
+    """Read the MIME type from the Content-Type header, falling back to the URL"""
+    content_type = response.headers.get('Content-Type', '') if response is not None else ''
+    mime = content_type.split(';')[0].strip().lower()
+    if mime:
+        return mime
+    guessed, _ = mimetypes.guess_type(url.split('?')[0])
+    return guessed or 'application/octet-stream'
+
+
+class ImageStore:
+    """Deduplicating image store backed by a JSON manifest inside the output folder"""
+
+    def __init__(self, root, manifest_name=MANIFEST_NAME):
+        self.root = root
+        self.manifest_path = os.path.join(root, manifest_name)
+        self.objects = {}  # hash -> {path, size, mime}
+        self.urls = {}     # source URL -> hash
+        self.next_index = 0
+        self.load()
+
+    def load(self):
+        """Load the manifest from disk, if there is one"""
+        if not os.path.exists(self.manifest_path):
+            return
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.objects = data.get('objects', {})
+        self.urls = data.get('urls', {})
+        self.next_index = data.get('next_index', 0)
+
+    def save(self):
+        """Write the manifest back to disk"""
+        os.makedirs(self.root, exist_ok=True)
+        data = {
+            'version': 1,
+            'next_index': self.next_index,
+            'objects': self.objects,
+            'urls': self.urls,
+        }
+        atomic_write_json(self.manifest_path, data)
+
+    def _entry(self, url, digest):
+        obj = self.objects.get(digest)
+        if not obj or not os.path.exists(obj['path']):
+            return None
+        return {'url': url, 'hash': digest, **obj}
+
+    def lookup(self, url):
+        """Return the manifest entry for a source URL if its file is still on disk"""
+        digest = self.urls.get(url)
+        if digest is None:
+            return None
+        return self._entry(url, digest)
+
+    def put(self, url, content, mime, prefix, ext):
+        """
+        Store downloaded bytes for a URL.
+        Returns (entry, is_new); is_new is False when identical bytes were already stored,
+        in which case the URL is simply recorded as another alias of the existing file.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='.part-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        return self.put_file(url, tmp_path, content_hash(content), len(content), mime, prefix, ext)
+
+    def put_file(self, url, tmp_path, digest, size, mime, prefix, ext):
+        """
+        Store an already-downloaded temp file whose hash and size are known.
+        The temp file must live inside the store folder; it is renamed into place
+        atomically, or deleted when its content is already stored.
+        """
+        existing = self._entry(url, digest)
+        if existing:
+            os.remove(tmp_path)
+            self.urls[url] = digest
+            return existing, False
+
+        path = os.path.join(self.root, f"etsy_{prefix}_{self.next_index}.{ext}")
+        os.chmod(tmp_path, 0o644)  # mkstemp files are private by default
+        os.replace(tmp_path, path)
+        self.next_index += 1
+
+        self.objects[digest] = {'path': path, 'size': size, 'mime': mime}
+        self.urls[url] = digest
+        return self._entry(url, digest), True
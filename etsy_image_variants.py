@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Best-resolution image selection for the Etsy scrapers.
+Etsy serves every listing photo in several sizes (il_75x75, il_340x270, il_794xN,
+il_fullxfull, ...) and pages reference several of them through src and srcset.
+This groups those variants per photo and keeps only the one closest to a target width,
+so each listing image is downloaded once instead of once per thumbnail size.
+"""
+
+import re
+
+DEFAULT_TARGET_WIDTH = 794
+
+ETSY_SIZE_PATTERN = re.compile(r'/il_(\d+|full)x(\d+|N|full)\.')
+SOURCE_PRIORITY = {'src': 0, 'data-src': 1, 'data-lazy-src': 2, 'srcset': 3}
+
+
+def etsy_width(url):
+    """Width encoded in an Etsy size-coded URL; fullxfull is treated as unbounded"""
+    match = ETSY_SIZE_PATTERN.search(url)
+    if not match:
+        return None
+    if match.group(1) == 'full':
+        return float('inf')
+    return int(match.group(1))
+
+
+def descriptor_width(descriptor):
+    """Width from a srcset descriptor such as '794w'; density descriptors give None"""
+    if descriptor and descriptor.endswith('w') and descriptor[:-1].isdigit():
+        return int(descriptor[:-1])
+    return None
+
+
+def variant_key(ref):
+    """Identify the photo behind an image reference, ignoring its size"""
+    if ETSY_SIZE_PATTERN.search(ref.url):
+        return ('etsy', ETSY_SIZE_PATTERN.sub('/il_*.', ref.url.split('?')[0]))
+    if ref.source == 'css':
+        return ('url', ref.url)
+    return ('element', ref.element)
+
+
+def choose_variant(refs, target_width):
+    """
+    Pick the smallest variant at least target_width wide, or the widest one if none is.
+    Variants of unknown width are only used when no width is known at all.
+    """
+    sized = []
+    for ref in refs:
+        width = descriptor_width(ref.descriptor) or etsy_width(ref.url)
+        if width is not None:
+            sized.append((width, SOURCE_PRIORITY.get(ref.source, 9), ref))
+
+    if not sized:
+        return min(refs, key=lambda ref: SOURCE_PRIORITY.get(ref.source, 9))
+
+    large_enough = [item for item in sized if item[0] >= target_width]
+    if large_enough:
+        return min(large_enough, key=lambda item: (item[0], item[1]))[2]
+    return max(sized, key=lambda item: (item[0], -item[1]))[2]
+
+
+def select_image_jobs(assets, target_width=DEFAULT_TARGET_WIDTH):
+    """
+    (url, prefix) download jobs with one URL per photo, in page order: images first,
+    then CSS backgrounds, matching the order the scrapers have always used.
+    """
+    groups = {}
+    order = []
+    for ref in assets.images:
+        key = variant_key(ref)
+        if key not in groups:
+            groups[key] = []
+            order.append(key)
+        groups[key].append(ref)
+
+    images = []
+    backgrounds = []
+    for key in order:
+        refs = groups[key]
+        best = choose_variant(refs, target_width)
+        if all(ref.source == 'css' for ref in refs):
+            backgrounds.append((best.url, 'bg'))
+        else:
+            images.append((best.url, 'image'))
+    return images + backgrounds
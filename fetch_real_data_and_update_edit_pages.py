@@ -2,16 +2,44 @@
 """
 Script to fetch REAL product data from database and update all edit pages with actual current data.
 This will ensure all edit pages show the REAL data instead of default values.
+
+With --incremental only pages whose product row changed since the last run are
+regenerated, and pages of products that have since been deactivated are deleted. Only
+products updated since the last sync's watermark are downloaded (plus an id-only listing
+of the catalog to find deactivations), so a run costs little when few products changed.
 """
 
+import argparse
+import hashlib
+import inspect
 import os
 import re
 import json
+import sys
 import requests
 import base64
 
-def get_admin_token():
-    """Get admin token from browser local storage or prompt user"""
+from api_client import AdminApiClient, AdminAuthError, ApiError
+from atomic_write import atomic_write_json
+from edit_page_engine import BufferedPageWriter, add_engine_arguments, render_edit_pages
+from edit_page_index import RETIRED_NOTICE, edit_page_product_id
+
+def get_admin_token(provider, interactive=None):
+    """
+    Get an admin token without prompting (ADMIN_TOKEN, the cached token file or an API
+    login, see admin_credentials.py). Only falls back to asking for the token from the
+    browser's local storage when run interactively.
+    """
+    try:
+        return provider.get_token()
+    except AdminAuthError as e:
+        print(f"⚠️  {e}")
+    
+    if interactive is None:
+        interactive = sys.stdin.isatty()
+    if not interactive:
+        return None
+    
     print("🔑 To fetch real product data, I need your admin token.")
     print("📝 Please get your admin token from your browser:")
     print("   1. Open your browser's Developer Tools (F12)")
@@ -21,29 +49,20 @@ def get_admin_token():
     print("   5. Paste it here:")
     
     token = input("Enter your admin token: ").strip()
+    if token:
+        provider.use_token(token)
     return token
 
-def fetch_real_product_data(token):
-    """Fetch real product data from the database API"""
-    url = "http://localhost:3000/api/admin/products"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
-    try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            products = response.json()
-            print(f"✅ Successfully fetched {len(products)} products from database")
-            return products
-        else:
-            print(f"❌ Error fetching products: {response.status_code}")
-            print(f"Response: {response.text}")
-            return []
-    except Exception as e:
-        print(f"❌ Error connecting to API: {e}")
-        return []
+# Columns create_complete_edit_page_content reads, plus updated_at for incremental syncs
+PAGE_FIELDS = [
+    'id', 'name', 'description', 'price', 'original_price', 'category', 'stock_quantity',
+    'low_stock_threshold', 'sale_percentage', 'tags', 'colors', 'sizes', 'specifications',
+    'features', 'updated_at',
+]
+
+def fetch_real_product_data(client):
+    """Stream real product data from the database API, one page of products at a time"""
+    return client.iter_products(fields=PAGE_FIELDS)
 
 def clean_product_name(name):
     """Clean product name for use in filename"""
@@ -237,7 +256,7 @@ def create_complete_edit_page_content(product_data):
                         <label for="product-category" class="form-label">Category</label>
                         <select id="product-category" class="form-input">
                             <option value="Halloween" {'selected' if category == 'Halloween' else ''}>Halloween</option>
-                            <option value="Father\'s Day" {'selected' if category == 'Father\'s Day' else ''}>Father's Day</option>
+                            <option value="Father\'s Day" {'selected' if category == "Father's Day" else ''}>Father's Day</option>
                             <option value="Birthday" {'selected' if category == 'Birthday' else ''}>Birthday</option>
                             <option value="Custom" {'selected' if category == 'Custom' else ''}>Custom</option>
                             <option value="Cancer Awareness" {'selected' if category == 'Cancer Awareness' else ''}>Cancer Awareness</option>
@@ -561,70 +580,159 @@ def create_complete_edit_page_content(product_data):
     
     return html_content
 
-def get_existing_edit_pages():
-    """Get list of existing edit page filenames"""
-    pages_dir = "pages"
-    existing_pages = []
-    
-    if os.path.exists(pages_dir):
-        for filename in os.listdir(pages_dir):
-            if filename.startswith("product-edit-product-") and filename.endswith(".html"):
-                existing_pages.append(filename)
-    
-    return existing_pages
+SYNC_STATE_PATH = os.path.join("pages", ".edit_pages_sync.json")
+
+def product_fingerprint(product):
+    """Stable hash of a product row, so changes are caught even when updated_at is not bumped"""
+    canonical = json.dumps(product, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
 
-def extract_product_id_from_filename(filename):
-    """Extract product ID from edit page filename"""
-    match = re.search(r'product-edit-product-(\d+)_', filename)
-    if match:
-        return int(match.group(1))
-    return None
+def template_version():
+    """Hash of the page renderer; a changed template invalidates every page"""
+    return hashlib.sha256(inspect.getsource(create_complete_edit_page_content).encode('utf-8')).hexdigest()
+
+def load_sync_state(path=SYNC_STATE_PATH):
+    """Last sync watermark plus each synced product's updated_at and fingerprint"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"watermark": None, "template": None, "products": {}}
+
+def save_sync_state(state, path=SYNC_STATE_PATH):
+    atomic_write_json(path, state)
+
+def product_changed(product, state, full_rebuild):
+    """True if the product row differs from the one the last sync rendered"""
+    previous = state.get("products", {}).get(str(product['id']))
+    return full_rebuild or previous is None or previous['fingerprint'] != product_fingerprint(product)
+
+def sync_entry(product):
+    return {"updated_at": product.get('updated_at'), "fingerprint": product_fingerprint(product)}
+
+def fetch_changed_product_data(client, watermark, state, page_ids, live_ids):
+    """
+    Products to re-check on an incremental run: those updated at or after the watermark,
+    plus any product with a page that the last sync did not render. Fills live_ids with
+    every active product id, from an id-only listing, so deactivations are still found.
+    """
+    for product in client.iter_products(fields=['id']):
+        live_ids.add(product['id'])
+    fetched = set()
+    for product in client.iter_products(fields=PAGE_FIELDS, updated_after=watermark):
+        fetched.add(product['id'])
+        yield product
+    for product_id in sorted((live_ids & page_ids) - fetched):
+        if str(product_id) not in state.get("products", {}):
+            product = client.get_json(f'/api/admin/products/{product_id}')
+            # Same columns as the listing, so the fingerprint matches the next run's
+            yield {field: product.get(field) for field in PAGE_FIELDS}
 
 def main():
+    parser = argparse.ArgumentParser(description="Regenerate edit pages from the real product data in the database")
+    add_engine_arguments(parser)
+    parser.add_argument('--incremental', action='store_true',
+                        help="only regenerate pages whose product changed since the last run")
+    args = parser.parse_args()
+
     print("🔍 Fetching REAL product data and updating all edit pages...")
     
+    # Existing edit pages by product ID, from the edit page index
+    writer = BufferedPageWriter()
+    if writer.index.retired:
+        print(RETIRED_NOTICE)
+        return
+    
     # Get admin token
-    token = get_admin_token()
+    client = AdminApiClient()
+    token = get_admin_token(client.token_provider)
     if not token:
         print("❌ No token provided. Exiting.")
         return
     
-    # Fetch real product data
-    products = fetch_real_product_data(token)
-    if not products:
-        print("❌ No products fetched. Exiting.")
-        return
+    print(f"📁 Found {len(writer.index.pages)} existing edit pages")
+    pages_by_id = {product_id: writer.index.pages_for(product_id) for product_id in writer.index.product_ids()}
     
-    # Create a mapping of product IDs to product data
-    product_map = {product['id']: product for product in products}
+    state = load_sync_state() if args.incremental else {}
+    full_rebuild = args.incremental and state.get("template") != template_version()
+    if args.incremental:
+        print(f"🔄 Last sync: {state.get('watermark') or 'never'}")
+    # A changed template re-renders everything, so it needs every product
+    watermark = state.get("watermark") if args.incremental and not full_rebuild else None
     
-    # Get existing edit pages
-    existing_pages = get_existing_edit_pages()
-    print(f"📁 Found {len(existing_pages)} existing edit pages")
+    live_ids = set()
+    synced = {}
+    if watermark:
+        # Products not downloaded this run keep their entries (pruned to live ids below)
+        synced = {int(product_id): entry for product_id, entry in state.get("products", {}).items()}
+        products = fetch_changed_product_data(client, watermark, state, set(pages_by_id), live_ids)
+    else:
+        products = fetch_real_product_data(client)
     
-    # Update each edit page with real data
-    pages_dir = "pages"
-    updated_count = 0
+    def iter_jobs():
+        """Update each edit page with real data, as products stream in from the API"""
+        for product in products:
+            product_id = product['id']
+            live_ids.add(product_id)
+            filenames = pages_by_id.get(product_id, [])
+            if filenames:
+                synced[product_id] = sync_entry(product)
+            if args.incremental and not product_changed(product, state, full_rebuild):
+                continue
+            for filename in filenames:
+                yield filename, create_complete_edit_page_content, (product,), product.get('name')
     
-    for filename in existing_pages:
-        product_id = extract_product_id_from_filename(filename)
-        if product_id and product_id in product_map:
-            product_data = product_map[product_id]
-            
-            # Create the complete edit page content with REAL data
-            content = create_complete_edit_page_content(product_data)
-            
-            # Write the updated file
-            filepath = os.path.join(pages_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
+    updated_count = 0
+    try:
+        for filename, written, error in render_edit_pages(iter_jobs(), args.workers,
+                                                          compiled=args.compiled_template, writer=writer):
+            if error:
+                print(f"❌ Error updating {filename}: {error}")
+                # Leave it out of the sync state so the next run retries it
+                synced.pop(edit_page_product_id(filename), None)
+                continue
             updated_count += 1
-            print(f"✅ Updated: {filename} with REAL data for product {product_id}")
-        else:
-            print(f"⚠️  Skipped: {filename} - Product ID {product_id} not found in database")
+            if written:
+                print(f"✅ Updated: {filename} with REAL data")
+    except (ApiError, AdminAuthError, requests.RequestException) as e:
+        print(f"❌ Error fetching products: {e}")
+        return
+    
+    if not live_ids:
+        print("❌ No products fetched. Exiting.")
+        return
+    print(f"✅ Fetched {len(live_ids)} products from database")
+    
+    # Products the last sync rendered that the API no longer returns were deactivated
+    deactivated_ids = set()
+    if args.incremental:
+        deactivated_ids = {int(product_id) for product_id in state.get("products", {})} - live_ids
+    for product_id, filenames in pages_by_id.items():
+        if product_id in live_ids:
+            continue
+        for filename in filenames:
+            if product_id in deactivated_ids:
+                if writer.remove(filename):
+                    print(f"🗑️  Deleted: {filename} - product was deactivated")
+            else:
+                print(f"⚠️  Skipped: {filename} - Product ID {product_id} not found in database")
+    
+    if args.incremental:
+        synced = {product_id: entry for product_id, entry in synced.items()
+                  if product_id in live_ids and pages_by_id.get(product_id)}
+        watermark = max((str(entry['updated_at']) for entry in synced.values() if entry['updated_at']),
+                        default=None)
+        save_sync_state({
+            "watermark": watermark,
+            "template": template_version(),
+            "products": {str(product_id): entry for product_id, entry in synced.items()},
+        })
+    # Saved last, so the pages directory mtime it records includes the sync state file
+    writer.save_index()
     
     print(f"🎉 Successfully updated {updated_count} edit pages with REAL product data!")
+    print(f"📊 Pages: {writer.summary()}")
+    print(f"📡 API: {client.session.summary()}")
     print("📝 Now all edit pages will show the ACTUAL current data from your database!")
 
 if __name__ == "__main__":
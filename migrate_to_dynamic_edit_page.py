@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Retire the per-product edit pages in favour of the single dynamic edit page.
+pages/product-edit.html loads the product from /api/admin/products/:id, and server.js
+serves it under a content-hashed, immutable URL, so one cached file replaces the
+product-edit-product-{id}_{slug}.html copy every product used to get.
+
+The migration:
+    1. rewrites every link to a per-product page into /product-edit.html?id={id}
+       (one page_patch pass over the site's HTML and JS)
+    2. deletes the per-product pages listed in the edit page index and marks them retired
+       in edit_pages_retired.json, so the Python generators and server.js's product
+       create/update hooks stop writing them (commit that file with the deletions)
+server.js then redirects any old URL (bookmarks, emails, stray files) to the dynamic page.
+
+    python migrate_to_dynamic_edit_page.py --dry-run      # show the link diffs and pages to delete
+    python migrate_to_dynamic_edit_page.py
+    python migrate_to_dynamic_edit_page.py --keep-files   # only rewrite the links
+"""
+
+import argparse
+import os
+import sys
+
+from edit_page_engine import BufferedPageWriter
+from edit_page_index import parse_edit_page_filename
+from page_patch import PatchRule, add_patch_arguments, report, target_files
+
+DYNAMIC_EDIT_PAGE = os.path.join("pages", "product-edit.html")
+LINK_GLOBS = ["*.html", "pages/*.html", "pages/*.js", "public/*.js"]
+
+# ../pages/product-edit-product-07_some_slug.html -> /product-edit.html?id=7
+LINK_PATTERN = r'(?:\.\./|/)?(?:pages/)?product-edit-product-0*(\d+)_[A-Za-z0-9_]*\.html'
+LINK_REPLACEMENT = r'/product-edit.html?id=\1'
+
+RULES = [PatchRule("dynamic edit page links", LINK_GLOBS, LINK_PATTERN, LINK_REPLACEMENT, regex=True)]
+
+
+def link_targets():
+    """Files that may link to edit pages, except the per-product pages themselves"""
+    return [path for path in target_files(RULES) if not parse_edit_page_filename(os.path.basename(path))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replace the per-product edit pages with the dynamic edit page")
+    add_patch_arguments(parser)
+    parser.add_argument('--keep-files', action='store_true', help="rewrite links but keep the per-product pages")
+    args = parser.parse_args()
+    args.paths = link_targets()
+
+    if not os.path.exists(DYNAMIC_EDIT_PAGE):
+        print(f"❌ {DYNAMIC_EDIT_PAGE} is missing; it has to exist before the per-product pages can go")
+        sys.exit(1)
+
+    print("🔗 Rewriting links to per-product edit pages...")
+    changed, failed = report(RULES, args)
+    if failed:
+        print("❌ Some links could not be rewritten; keeping the per-product pages")
+        sys.exit(1)
+    if args.keep_files:
+        return
+
+    writer = BufferedPageWriter()
+    filenames = writer.index.filenames()
+    freed = sum(entry.get('size') or 0 for entry in writer.index.pages.values())
+    print(f"\n🗑️  {'Would retire' if args.dry_run else 'Retiring'} {len(filenames)} per-product edit pages "
+          f"({freed / 1024:.0f} KB)")
+    if args.dry_run:
+        for filename in filenames:
+            print(f"  would delete pages/{filename}")
+        return
+
+    for filename in filenames:
+        writer.remove(filename)
+    writer.index.retire()
+    writer.save_index()
+    print(f"📊 Pages: {writer.summary()}")
+    print("📝 Every product is now edited through /product-edit.html?id=<id>")
+    print("📝 Commit edit_pages_retired.json with the deleted pages so every deployment stops generating them")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Declarative patches for the static pages.
+A fix is a list of PatchRule(name, glob, match, replacement) instead of its own
+read / re.sub / write loop. All rules that apply to a file are combined into one
+alternation regex, so a file is read once, scanned once and written once however many
+rules there are. At any position the first matching rule (in declaration order) wins and
+replacements never overlap or cascade into each other.
+
+Literal rules are joined into a plain a|b|c alternation without groups (named groups
+would stop re from using its fast literal search) and the matched text identifies the
+rule. Regex rules are combined as (?P<r0>...)|(?P<r1>...), except those with groups of
+their own (backreferences, named groups) or inline flags, which keep their own pattern
+since combining would renumber and rename their groups. The matches of these scanners
+are merged into the same left-to-right scan with the same precedence.
+
+Rule modules (revert_currency_to_usd.py, fix_tailwind_cdn_in_all_edit_pages.py) define
+RULES; any number of them can be applied in one pass:
+    python page_patch.py revert_currency_to_usd fix_tailwind_cdn_in_all_edit_pages --dry-run
+    python page_patch.py fix_tailwind_cdn_in_all_edit_pages --workers 4
+"""
+
+import argparse
+import difflib
+import fnmatch
+import glob
+import importlib
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from atomic_write import atomic_write
+
+class PatchRule:
+    """
+    One fix: in files matching glob (one pattern or a list of them), replace match with replacement.
+    match is literal text unless regex=True, in which case match may use groups and
+    backreferences, and replacement \\1 / \\g<name> references to them.
+    """
+
+    def __init__(self, name, glob, match, replacement, regex=False):
+        self.name = name
+        self.glob = glob
+        self.match = match
+        self.replacement = replacement
+        self.regex = regex
+        self.pattern = re.compile(match if regex else re.escape(match))
+
+    @property
+    def standalone(self):
+        """True if the pattern cannot be nested in the combined alternation (groups, inline flags)"""
+        return bool(self.pattern.groups or self.pattern.flags & ~re.UNICODE)
+
+    @property
+    def globs(self):
+        return [self.glob] if isinstance(self.glob, str) else list(self.glob)
+
+    def applies_to(self, path):
+        path = os.path.normpath(path)
+        return any(fnmatch.fnmatch(path, os.path.normpath(pattern)) for pattern in self.globs)
+
+    def replace(self, content, position):
+        """Replacement for the occurrence at position (the combined scan already found it)"""
+        if not self.regex:
+            return self.replacement
+        # Re-match at the same position (not on a slice) so anchors and lookbehinds still see
+        # the surrounding text, and so the rule's group numbers are its own
+        return self.pattern.match(content, position).expand(self.replacement)
+
+    def key(self):
+        return (self.name, tuple(self.globs), self.match, self.replacement, self.regex)
+
+    def __repr__(self):
+        return f"PatchRule({self.name!r}, {self.glob!r})"
+
+
+class CombinedMatcher:
+    """
+    All rules for one file scanned together left to right: literal rules as one group-free
+    alternation, regex rules as one (?P<r0>...)|(?P<r1>...) alternation, and standalone
+    rules with their own patterns
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        # Matched text -> index of the first-declared literal rule with that text
+        self.literals = {}
+        for i, rule in enumerate(self.rules):
+            if not rule.regex:
+                self.literals.setdefault(rule.match, i)
+        combined = [i for i, rule in enumerate(self.rules) if rule.regex and not rule.standalone]
+        # (pattern, function mapping one of its matches to the rule index)
+        self.scanners = []
+        if self.literals:
+            # Declaration order is kept, so the first listed alternative still wins at a position
+            self.scanners.append((re.compile('|'.join(re.escape(match) for match in self.literals)),
+                                  self._literal_rule))
+        if combined:
+            self.scanners.append((re.compile('|'.join(f'(?P<r{i}>{self.rules[i].pattern.pattern})'
+                                                      for i in combined)), self._combined_rule))
+        self.scanners.extend((rule.pattern, lambda match, i=i: i)
+                             for i, rule in enumerate(self.rules) if rule.regex and rule.standalone)
+
+    def _literal_rule(self, match):
+        return self.literals[match.group()]
+
+    @staticmethod
+    def _combined_rule(match):
+        # The rule's outer group closes last, so lastgroup names it
+        return int(match.lastgroup[1:])
+
+    def _matches(self, content):
+        """The non-overlapping (rule index, match) pairs, leftmost first, earlier rules winning ties"""
+        if len(self.scanners) == 1:
+            pattern, rule_for = self.scanners[0]
+            for match in pattern.finditer(content):
+                yield rule_for(match), match
+            return
+        upcoming = [None] * len(self.scanners)
+        position = 0
+        while position <= len(content):
+            best = None
+            for n, (pattern, rule_for) in enumerate(self.scanners):
+                match = upcoming[n]
+                # A match found from an earlier position is still the next one if it starts here or later
+                if match is None or (match is not False and match.start() < position):
+                    match = upcoming[n] = pattern.search(content, position) or False
+                if match is False:
+                    continue
+                key = (match.start(), rule_for(match))
+                if best is None or key < best[0]:
+                    best = key, match
+            if best is None:
+                return
+            (start, index), match = best
+            yield index, match
+            position = match.end() if match.end() > start else start + 1
+
+    def apply(self, content):
+        """Returns (new_content, {rule name: replacements made})"""
+        counts = {}
+        parts = []
+        last = 0
+        for index, match in self._matches(content):
+            rule = self.rules[index]
+            parts.append(content[last:match.start()])
+            parts.append(rule.replace(content, match.start()))
+            last = match.end()
+            counts[rule.name] = counts.get(rule.name, 0) + 1
+        if not parts:
+            return content, counts
+        parts.append(content[last:])
+        return ''.join(parts), counts
+
+
+_matchers = {}
+
+
+def matcher_for(rules, path):
+    """The combined matcher for the rules that apply to path (cached per rule combination)"""
+    applicable = tuple(rule for rule in rules if rule.applies_to(path))
+    if not applicable:
+        return None
+    # Keyed by content: worker processes receive fresh copies of the rules with every task
+    key = tuple(rule.key() for rule in applicable)
+    if key not in _matchers:
+        _matchers[key] = CombinedMatcher(applicable)
+    return _matchers[key]
+
+
+def target_files(rules):
+    """Every file matched by at least one rule's glob, in a stable order"""
+    paths = set()
+    for rule in rules:
+        for pattern in rule.globs:
+            paths.update(glob.glob(pattern))
+    return sorted(paths)
+
+
+def unified_diff(path, before, after):
+    return ''.join(difflib.unified_diff(before.splitlines(True), after.splitlines(True),
+                                        fromfile=f"a/{path}", tofile=f"b/{path}", n=1))
+
+
+def patch_file(path, rules, dry_run=False, diff=False):
+    """
+    Worker: apply every applicable rule to one file in a single read / scan / write.
+    Returns (path, {rule name: count}, diff text or None).
+    """
+    matcher = matcher_for(rules, path)
+    if matcher is None:
+        return path, {}, None
+    with open(path, 'r', encoding='utf-8') as f:
+        original = f.read()
+    patched, counts = matcher.apply(original)
+    if patched == original:
+        return path, {}, None
+    if not dry_run:
+        atomic_write(path, patched)
+    return path, counts, unified_diff(path, original, patched) if diff else None
+
+
+def apply_rules(rules, paths=None, dry_run=False, diff=False, workers=None):
+    """
+    Apply rules to paths (default: everything their globs match), in a process pool.
+    Yields (path, counts, diff, error) for every file that changed or failed.
+    """
+    paths = target_files(rules) if paths is None else paths
+    for path, result, error in _patch_all(paths, rules, dry_run, diff, workers):
+        if error:
+            yield path, {}, None, error
+        elif result[1]:
+            yield path, result[1], result[2], None
+
+
+def _patch_all(paths, rules, dry_run, diff, workers):
+    if workers == 1 or len(paths) <= 1:
+        for path in paths:
+            try:
+                yield path, patch_file(path, rules, dry_run, diff), None
+            except Exception as e:
+                yield path, None, str(e)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(patch_file, path, rules, dry_run, diff) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                yield path, future.result(), None
+            except Exception as e:
+                yield path, None, str(e)
+
+
+def load_rules(module_names):
+    """RULES from each rule module, in the order given"""
+    rules = []
+    for name in module_names:
+        module = importlib.import_module(name[:-3] if name.endswith('.py') else name)
+        rules.extend(module.RULES)
+    return rules
+
+
+def run(rules, argv=None, description="Apply page patch rules"):
+    """Command line for a rule set: [paths] --dry-run --diff --workers"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('paths', nargs='*', help="files to patch (default: every file the rules target)")
+    add_patch_arguments(parser)
+    args = parser.parse_args(argv)
+    return report(rules, args)
+
+
+def add_patch_arguments(parser):
+    parser.add_argument('--dry-run', action='store_true', help="report changes without writing")
+    parser.add_argument('--diff', action='store_true', help="print a unified diff of every change")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="process pool size (default: one per CPU; 1 patches serially)")
+
+
+def report(rules, args):
+    paths = args.paths or None
+    print(f"🔧 {'Checking' if args.dry_run else 'Applying'} {len(rules)} rules: "
+          f"{', '.join(rule.name for rule in rules)}")
+    changed = 0
+    failed = 0
+    totals = {}
+    for path, counts, text, error in apply_rules(rules, paths, args.dry_run, args.diff or args.dry_run,
+                                                 args.workers):
+        if error:
+            failed += 1
+            print(f"  ❌ Error patching {path}: {error}")
+            continue
+        changed += 1
+        for name, count in counts.items():
+            totals[name] = totals.get(name, 0) + count
+        if text:
+            sys.stdout.write(text)
+        print(f"  ✅ {'Would update' if args.dry_run else 'Updated'} {path} "
+              f"({', '.join(f'{name} x{count}' for name, count in counts.items())})")
+
+    print(f"\n✅ {changed} files {'would change' if args.dry_run else 'updated'}, {failed} failed")
+    for rule in rules:
+        print(f"   {rule.name}: {totals.get(rule.name, 0)} replacements")
+    return changed, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply the rules of one or more rule modules in one pass")
+    parser.add_argument('modules', nargs='+', help="rule modules, e.g. fix_tailwind_cdn_in_all_edit_pages")
+    parser.add_argument('--paths', nargs='*', default=None, help="limit to these files")
+    add_patch_arguments(parser)
+    args = parser.parse_args()
+    report(load_rules(args.modules), args)
+
+
+if __name__ == "__main__":
+    main()
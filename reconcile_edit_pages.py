@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Reconcile pages/ with the live product list in one pass.
+Products stream from the admin API (keyset-paged, see api_client.py) and are joined
+against the edit page index (see edit_page_index.py), so pages/ is never rescanned:
+    - a product with several product-edit-product-{id}_*.html pages (the generators have
+      used different slug rules over time) keeps one page and the others are deleted,
+      preferring the canonical name and then the most recently generated page
+    - a product without a page gets one, rendered from its real data (unless per-product
+      pages were retired by migrate_to_dynamic_edit_page.py)
+    - pages whose product id is no longer active are deleted, but only after the whole
+      product list was read, so a failed or partial fetch never deletes anything
+
+    python reconcile_edit_pages.py --dry-run   # report what would change
+    python reconcile_edit_pages.py
+"""
+
+import argparse
+
+import requests
+
+from api_client import AdminApiClient, AdminAuthError, ApiError
+from edit_page_engine import BufferedPageWriter, add_engine_arguments, render_edit_pages
+from fetch_real_data_and_update_edit_pages import (
+    PAGE_FIELDS,
+    clean_product_name,
+    create_complete_edit_page_content,
+)
+
+
+def canonical_filename(product):
+    """The name create_missing_edit_pages.py and the server-side generator give a new page"""
+    return f"product-edit-product-{product['id']:02d}_{clean_product_name(product.get('name'))}.html"
+
+
+def page_to_keep(index, filenames, canonical):
+    """The page to keep among a product's duplicates"""
+    if canonical in filenames:
+        return canonical
+    return max(filenames, key=lambda filename: (index.get(filename).get('generated_at') or '',
+                                                index.get(filename).get('mtime_ns') or 0, filename))
+
+
+class Reconciler:
+    """Joins the streamed product list with the edit page index, collecting the plan as it goes"""
+
+    def __init__(self, writer, dry_run=False):
+        self.writer = writer
+        self.index = writer.index
+        self.dry_run = dry_run
+        self.live_ids = set()
+        self.duplicates_removed = 0
+        self.orphans_removed = 0
+        self.to_create = 0
+
+    def remove(self, filename, reason):
+        if self.dry_run:
+            print(f"🗑️  Would delete: {filename} - {reason}")
+            return True
+        if self.writer.remove(filename):
+            print(f"🗑️  Deleted: {filename} - {reason}")
+            return True
+        return False
+
+    def iter_jobs(self, products):
+        """Collapse duplicates per product and yield a render job for every product without a page"""
+        for product in products:
+            product_id = product['id']
+            self.live_ids.add(product_id)
+            filenames = self.index.pages_for(product_id)
+            if not filenames:
+                if self.index.retired:
+                    continue
+                self.to_create += 1
+                filename = canonical_filename(product)
+                if self.dry_run:
+                    print(f"➕ Would create: {filename}")
+                    continue
+                yield filename, create_complete_edit_page_content, (product,), product.get('name')
+                continue
+            if len(filenames) > 1:
+                keep = page_to_keep(self.index, filenames, canonical_filename(product))
+                for filename in filenames:
+                    if filename != keep and self.remove(filename, f"duplicate of {keep}"):
+                        self.duplicates_removed += 1
+
+    def remove_orphans(self):
+        """Delete pages of every product id the (complete) product list did not contain"""
+        for product_id in sorted(self.index.product_ids() - self.live_ids):
+            for filename in self.index.pages_for(product_id):
+                if self.remove(filename, f"product {product_id} is not active"):
+                    self.orphans_removed += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collapse duplicate edit pages, delete orphans and create missing pages")
+    add_engine_arguments(parser)
+    parser.add_argument('--dry-run', action='store_true', help="report what would change without touching pages/")
+    parser.add_argument('--page-size', type=int, default=200, help="products fetched per API request")
+    args = parser.parse_args()
+
+    print(f"🔍 Reconciling edit pages with the live product list{' (dry run)' if args.dry_run else ''}...")
+    client = AdminApiClient()
+    writer = BufferedPageWriter()
+    print(f"📁 Index: {len(writer.index.pages)} edit pages for {len(writer.index.by_id)} products")
+    reconciler = Reconciler(writer, args.dry_run)
+
+    created = 0
+    try:
+        jobs = reconciler.iter_jobs(client.iter_products(fields=PAGE_FIELDS, page_size=args.page_size))
+        if args.dry_run:
+            for _ in jobs:
+                pass
+            created = reconciler.to_create
+        else:
+            for filename, written, error in render_edit_pages(jobs, args.workers, compiled=args.compiled_template,
+                                                              writer=writer):
+                if error:
+                    print(f"❌ Error creating {filename}: {error}")
+                    continue
+                created += 1
+                print(f"✅ Created: {filename}")
+    except (ApiError, AdminAuthError, requests.RequestException) as e:
+        print(f"❌ Error fetching products, no orphans deleted: {e}")
+        return
+
+    if not reconciler.live_ids:
+        print("❌ The API returned no active products; refusing to delete every page")
+        return
+    reconciler.remove_orphans()
+    if not args.dry_run:
+        writer.save_index()
+
+    verb = "would be" if args.dry_run else "were"
+    print(f"\n✅ {len(reconciler.live_ids)} live products: {reconciler.duplicates_removed} duplicate pages, "
+          f"{reconciler.orphans_removed} orphaned pages {verb} deleted; {created} missing pages {verb} created")
+    print(f"📊 Pages: {writer.summary()}")
+    print(f"📡 API: {client.session.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -440,6 +440,33 @@ app.use(helmet({
   referrerPolicy: { policy: "strict-origin-when-cross-origin" }
 }));
 
+// Per-product edit pages (product-edit-product-{id}_{slug}.html) are retired once
+// migrate_to_dynamic_edit_page.py has run: it sets `retired` in the committed
+// edit_pages_retired.json, and from then on the server neither generates them nor serves leftovers
+const EDIT_PAGES_RETIRED_FILE = path.join(__dirname, 'edit_pages_retired.json');
+let editPagesRetiredCache = null;
+
+function perProductEditPagesRetired() {
+  try {
+    const stat = fs.statSync(EDIT_PAGES_RETIRED_FILE);
+    if (!editPagesRetiredCache || editPagesRetiredCache.mtimeMs !== stat.mtimeMs) {
+      const state = JSON.parse(fs.readFileSync(EDIT_PAGES_RETIRED_FILE, 'utf8'));
+      editPagesRetiredCache = { retired: state.retired === true, mtimeMs: stat.mtimeMs };
+    }
+    return editPagesRetiredCache.retired;
+  } catch (error) {
+    return false;
+  }
+}
+
+// Ahead of express.static, so retired pages still on disk never shadow the dynamic page
+app.get(/^\/(?:pages\/)?product-edit-product-(\d+)_[^/]*\.html$/, (req, res, next) => {
+  if (!perProductEditPagesRetired()) {
+    return next();
+  }
+  res.redirect(301, `/product-edit.html?id=${parseInt(req.params[0], 10)}`);
+});
+
 app.use(express.static('.'));
 app.use('/public', express.static('public'));
 // Removed etsy_images static route - now using Cloudinary for image hosting
@@ -5552,6 +5579,14 @@ app.post('/api/upload-image', authenticateToken, async (req, res) => {
 
 // Admin Product Management Endpoints
 app.get('/api/admin/products', authenticateToken, async (req, res) => {
+  const { fields, after_id, limit, updated_after } = req.query;
+  const paged = fields !== undefined || after_id !== undefined || limit !== undefined || updated_after !== undefined;
+
+  if (!databaseAvailable && paged) {
+    // Paged callers (the page generators) treat the result as the whole catalog; a mock
+    // list would make them delete every other product's page
+    return res.status(503).json({ error: 'Database unavailable' });
+  }
   if (!databaseAvailable) {
     logger.warn('⚠️ Database unavailable - returning mock products for testing');
     return res.json([
@@ -5578,16 +5613,66 @@ app.get('/api/admin/products', authenticateToken, async (req, res) => {
   }
 
   try {
-    const result = await pool.query(`
-      SELECT * FROM products WHERE is_active = true ORDER BY created_at DESC
-    `);
-    res.json(result.rows);
+    // Without paging/projection parameters keep the original full response (admin dashboard)
+    if (!paged) {
+      const result = await pool.query(`
+        SELECT * FROM products WHERE is_active = true ORDER BY created_at DESC
+      `);
+      return res.json(result.rows);
+    }
+
+    // Keyset pagination by id, optionally projected to ?fields=a,b,c (id is always included)
+    let columns = '*';
+    if (fields) {
+      const available = await getProductColumns();
+      const requested = [...new Set(['id', ...String(fields).split(',').map(f => f.trim()).filter(Boolean)])];
+      const unknown = requested.filter(f => !available.has(f));
+      if (unknown.length > 0) {
+        return res.status(400).json({ error: `Unknown product fields: ${unknown.join(', ')}` });
+      }
+      columns = requested.map(f => `"${f}"`).join(', ');
+    }
+    const pageSize = Math.min(parseInt(limit, 10) || 100, 500);
+    const afterId = parseInt(after_id, 10) || 0;
+    const params = [afterId, pageSize];
+    // ?updated_after=<ISO timestamp> limits the page to products changed since then (inclusive)
+    let updatedFilter = '';
+    if (updated_after !== undefined) {
+      const updatedAfter = new Date(updated_after);
+      if (isNaN(updatedAfter.getTime())) {
+        return res.status(400).json({ error: 'updated_after must be an ISO timestamp' });
+      }
+      params.push(updatedAfter);
+      updatedFilter = 'AND updated_at >= $3';
+    }
+
+    const result = await pool.query(
+      `SELECT ${columns} FROM products WHERE is_active = true AND id > $1 ${updatedFilter} ORDER BY id LIMIT $2`,
+      params
+    );
+    const rows = result.rows;
+    res.json({
+      products: rows,
+      next_after_id: rows.length === pageSize ? rows[rows.length - 1].id : null
+    });
   } catch (error) {
     logger.error('Error fetching products:', error);
     res.status(500).json({ error: 'Failed to fetch products' });
   }
 });
 
+// Column names of the products table, used to validate ?fields= projections
+let productColumnsCache = null;
+async function getProductColumns() {
+  if (!productColumnsCache) {
+    const result = await pool.query(`
+      SELECT column_name FROM information_schema.columns WHERE table_name = 'products'
+    `);
+    productColumnsCache = new Set(result.rows.map(row => row.column_name));
+  }
+  return productColumnsCache;
+}
+
 // Get single product by ID
 app.get('/api/admin/products/:id', authenticateToken, async (req, res) => {
   if (!pool) {
@@ -5860,15 +5945,19 @@ app.post('/api/admin/products', authenticateToken, validateProduct, async (req,
 
     logger.info(`✅ Product created with ID ${nextId}`);
 
-    // Create edit page for the new product
+    // Create edit page for the new product (unless /product-edit.html?id= serves every product)
     try {
-      const { createEditPageForProduct } = require('./create_edit_page_for_product.js');
-      const editPageCreated = createEditPageForProduct(nextId, name);
-      
-      if (editPageCreated) {
-        logger.info(`✅ Edit page created for product ${nextId}`);
+      if (perProductEditPagesRetired()) {
+        logger.info(`✅ Product ${nextId} is edited through /product-edit.html?id=${nextId}`);
       } else {
-        logger.info(`⚠️ Failed to create edit page for product ${nextId}`);
+        const { createEditPageForProduct } = require('./create_edit_page_for_product.js');
+        const editPageCreated = createEditPageForProduct(nextId, name);
+        
+        if (editPageCreated) {
+          logger.info(`✅ Edit page created for product ${nextId}`);
+        } else {
+          logger.info(`⚠️ Failed to create edit page for product ${nextId}`);
+        }
       }
     } catch (editPageError) {
       logger.error('❌ Error creating edit page:', editPageError);
@@ -6142,15 +6231,17 @@ app.put('/api/admin/products/:id', authenticateToken, validateProduct, async (re
       return res.status(404).json({ error: 'Product not found' });
     }
 
-    // Update edit page if product name changed
+    // Update edit page if product name changed (not needed once per-product pages are retired)
     try {
-      const { createEditPageForProduct } = require('./create_edit_page_for_product.js');
-      const editPageCreated = createEditPageForProduct(productId, name);
-      
-      if (editPageCreated) {
-        logger.info(`✅ Edit page updated for product ${productId} with new name: ${name}`);
-      } else {
-        logger.info(`⚠️ Failed to update edit page for product ${productId}`);
+      if (!perProductEditPagesRetired()) {
+        const { createEditPageForProduct } = require('./create_edit_page_for_product.js');
+        const editPageCreated = createEditPageForProduct(productId, name);
+        
+        if (editPageCreated) {
+          logger.info(`✅ Edit page updated for product ${productId} with new name: ${name}`);
+        } else {
+          logger.info(`⚠️ Failed to update edit page for product ${productId}`);
+        }
       }
     } catch (editPageError) {
       logger.error('❌ Error updating edit page:', editPageError);
@@ -8861,8 +8952,57 @@ app.get('/admin-uploads.html', (req, res) => {
 });
 
 // Serve product edit page
+// One page edits every product: it holds no product data (it loads /api/admin/products/:id),
+// so it is served under a content-hashed URL that browsers and CDNs may cache forever, and
+// /product-edit.html redirects there. A redeploy changes the hash, so nobody sees a stale page.
+const PRODUCT_EDIT_PAGE = path.join(__dirname, 'pages', 'product-edit.html');
+let productEditPageCache = null;
+
+function getProductEditPage() {
+  const stat = fs.statSync(PRODUCT_EDIT_PAGE);
+  if (!productEditPageCache || productEditPageCache.mtimeMs !== stat.mtimeMs) {
+    const body = fs.readFileSync(PRODUCT_EDIT_PAGE);
+    const hash = crypto.createHash('sha256').update(body).digest('hex').slice(0, 12);
+    productEditPageCache = { body, hash, mtimeMs: stat.mtimeMs };
+  }
+  return productEditPageCache;
+}
+
+function productEditPageUrl(req, hash) {
+  const queryStart = req.originalUrl.indexOf('?');
+  return `/product-edit.${hash}.html${queryStart === -1 ? '' : req.originalUrl.slice(queryStart)}`;
+}
+
 app.get('/product-edit.html', (req, res) => {
-  res.sendFile(path.join(__dirname, 'pages', 'product-edit.html'));
+  try {
+    res.redirect(302, productEditPageUrl(req, getProductEditPage().hash));
+  } catch (error) {
+    logger.error('Error loading product edit page:', error);
+    res.status(404).send('Product edit page not found');
+  }
+});
+
+app.get(/^\/product-edit\.([0-9a-f]{12})\.html$/, (req, res) => {
+  let page;
+  try {
+    page = getProductEditPage();
+  } catch (error) {
+    logger.error('Error loading product edit page:', error);
+    return res.status(404).send('Product edit page not found');
+  }
+  if (req.params[0] !== page.hash) {
+    // An old hash (the page was redeployed since): send the client to the current version
+    return res.redirect(302, productEditPageUrl(req, page.hash));
+  }
+  res.removeHeader('Pragma');
+  res.removeHeader('Expires');
+  res.set('Cache-Control', 'public, max-age=31536000, immutable');
+  res.type('html').send(page.body);
+});
+
+// Links to per-product edit pages that no longer exist land on the dynamic page instead
+app.get(/^\/(?:pages\/)?product-edit-product-(\d+)_[^/]*\.html$/, (req, res) => {
+  res.redirect(301, `/product-edit.html?id=${parseInt(req.params[0], 10)}`);
 });
 
 // Serve privacy policy page
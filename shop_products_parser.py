@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Streaming parser for the `const allProducts = [...]` array embedded in shop.html.
+Reads the file in chunks and tokenizes the JavaScript object literals one at a time,
+so products come out as a generator and memory stays flat however large the page is.
+Handles single/double-quoted strings with escapes, keys in any order, extra fields,
+nested arrays/objects and comments.
+
+Benchmark against the old regex extraction on a synthetic shop.html:
+    python shop_products_parser.py --benchmark --count 10000
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import time
+
+CHUNK_SIZE = 64 * 1024
+# Characters that must follow a token before it is final; a number such as 2.5e+10 can
+# only grow by looking a few characters past what has been read so far
+LOOKAHEAD = 8
+
+# Leading whitespace is consumed with each token, which halves the number of matches
+TOKEN_PATTERN = re.compile(r'''\s*(?:
+      (?P<comment>//[^\n]*\n|/\*.*?\*/)
+    | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    | (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<ident>[A-Za-z_$][\w$]*)
+    | (?P<punct>[{}\[\]:,])
+)''', re.VERBOSE | re.DOTALL)
+
+ESCAPE_PATTERN = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)', re.DOTALL)
+SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+LITERALS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+
+class JSParseError(ValueError):
+    """Raised when the products array is not a JavaScript literal we understand"""
+
+
+def unescape_js_string(body):
+    """Decode the escape sequences of a JavaScript string literal body"""
+    def replace(match):
+        code = match.group(1)
+        if code[0] in 'ux' and len(code) > 1:
+            return chr(int(code[1:], 16))
+        return SIMPLE_ESCAPES.get(code, code)
+    return ESCAPE_PATTERN.sub(replace, body)
+
+
+class _Tokenizer:
+    """Pulls tokens out of a file, refilling its buffer one chunk at a time"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _refill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def seek_to(self, pattern):
+        """Advance just past the first match of a compiled pattern; False if never found"""
+        while True:
+            match = pattern.search(self.buf, self.pos)
+            # A match touching the end of the buffer might continue in the next chunk
+            if match and (match.end() < len(self.buf) or self.eof):
+                self.pos = match.end()
+                return True
+            if self.eof:
+                return False
+            # Keep a tail long enough for a marker split across two chunks
+            self.pos = max(self.pos, len(self.buf) - 256)
+            self._refill()
+
+    def next(self):
+        """Return the next (kind, text) token, or None at end of input"""
+        while True:
+            match = TOKEN_PATTERN.match(self.buf, self.pos)
+            # A token close to the end of the buffer may be cut off at the chunk boundary
+            if match is not None and (match.end() + LOOKAHEAD <= len(self.buf) or self.eof):
+                self.pos = match.end()
+                kind = match.lastgroup
+                if kind != 'comment':
+                    return kind, match.group(kind)
+                continue
+            if not self.eof and self._refill():
+                continue
+            if match is not None:
+                continue  # eof reached while refilling; the match is now final
+            if not self.buf[self.pos:].strip():
+                return None
+            raise JSParseError(f"Unexpected input near: {self.buf[self.pos:self.pos + 40]!r}")
+
+
+def _parse_value(tokenizer, token):
+    if token is None:
+        raise JSParseError("Unexpected end of input")
+    kind, text = token
+    if kind == 'string':
+        return unescape_js_string(text[1:-1])
+    if kind == 'number':
+        return float(text) if any(c in text for c in '.eE') else int(text)
+    if kind == 'ident':
+        if text not in LITERALS:
+            raise JSParseError(f"Unsupported identifier value: {text}")
+        return LITERALS[text]
+    if text == '{':
+        return _parse_object(tokenizer)
+    if text == '[':
+        return list(_iter_array(tokenizer))
+    raise JSParseError(f"Unexpected token: {text}")
+
+
+def _parse_object(tokenizer):
+    """Parse an object literal whose '{' was already consumed"""
+    result = {}
+    while True:
+        token = tokenizer.next()
+        if token is None:
+            raise JSParseError("Unterminated object literal")
+        kind, text = token
+        if text == '}':
+            return result
+        if text == ',':
+            continue  # also tolerates trailing commas
+        if kind == 'string':
+            key = unescape_js_string(text[1:-1])
+        elif kind in ('ident', 'number'):
+            key = text
+        else:
+            raise JSParseError(f"Unexpected token in object: {text}")
+        colon = tokenizer.next()
+        if colon is None or colon[1] != ':':
+            raise JSParseError(f"Expected ':' after key {key!r}")
+        result[key] = _parse_value(tokenizer, tokenizer.next())
+
+
+def _iter_array(tokenizer):
+    """Yield the elements of an array literal whose '[' was already consumed"""
+    while True:
+        token = tokenizer.next()
+        if token is None:
+            raise JSParseError("Unterminated array literal")
+        if token[1] == ']':
+            return
+        if token[1] == ',':
+            continue
+        yield _parse_value(tokenizer, token)
+
+
+def iter_js_array(f, variable='allProducts', chunk_size=CHUNK_SIZE):
+    """
+    Yield each element of `const|let|var <variable> = [...]` from an open text file.
+    Yields nothing if the variable is not assigned an array literal in the file.
+    """
+    marker = re.compile(r'\b(?:const|let|var)\s+' + re.escape(variable) + r'\s*=\s*\[')
+    tokenizer = _Tokenizer(f, chunk_size)
+    if not tokenizer.seek_to(marker):
+        return
+    yield from _iter_array(tokenizer)
+
+
+def _legacy_extract(content):
+    """The regex extraction add_all_products.py used before this parser (for benchmarks)"""
+    match = re.search(r"const allProducts = \[(.*?)\];", content, re.DOTALL)
+    if not match:
+        return []
+    product_pattern = r"\{\s*image:\s*'((?:[^'\\]|\\.)*)',\s*title:\s*'((?:[^'\\]|\\.)*)',\s*collection:\s*'((?:[^'\\]|\\.)*)',\s*price:\s*'((?:[^'\\]|\\.)*)',\s*rating:\s*'((?:[^'\\]|\\.)*)'\s*\}"
+    return re.findall(product_pattern, match.group(1), re.DOTALL)
+
+
+def write_synthetic_shop_html(path, count):
+    """Write a shop.html-like page with `count` products, mixing key orders and extras"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("<html><body><script>\n        const allProducts = [\n")
+        for i in range(count):
+            title = f"Kid\\'s Product {i} \"Special\" Shirt"
+            if i % 10 == 0:
+                # Reordered keys and extra fields, which the old regex could not match
+                f.write(f"            {{ title: '{title}', image: '../etsy_images/product_{i:03d}/01.jpg', "
+                        f"price: '$22.00', collection: 'Halloween Collection', rating: '5', "
+                        f"tags: ['custom', 'printed'], featured: true }},\n")
+            else:
+                f.write(f"            {{ image: '../etsy_images/product_{i:03d}/01.jpg', title: '{title}', "
+                        f"collection: 'Halloween Collection', price: '$22.00', rating: '5' }},\n")
+        f.write("        ];\n</script></body></html>\n")
+
+
+def benchmark(count, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'shop.html')
+        write_synthetic_shop_html(path, count)
+        size = os.path.getsize(path)
+        print(f"Benchmarking synthetic shop.html: {count:,} products, {size:,} bytes, best of {repeat} runs")
+
+        def run_stream():
+            with open(path, 'r', encoding='utf-8') as f:
+                return sum(1 for _ in iter_js_array(f))
+
+        def run_legacy():
+            with open(path, 'r', encoding='utf-8') as f:
+                return len(_legacy_extract(f.read()))
+
+        for name, run in (('streaming tokenizer', run_stream), ('regex (legacy)', run_legacy)):
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                found = run()
+                timings.append(time.perf_counter() - start)
+            print(f"  {name:<20} {min(timings) * 1000:9.2f} ms   {found:,} products")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse the allProducts array out of shop.html")
+    parser.add_argument('path', nargs='?', default='pages/shop.html')
+    parser.add_argument('--benchmark', action='store_true', help="benchmark on a synthetic shop.html")
+    parser.add_argument('--count', type=int, default=10000, help="products in the synthetic page")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.count, args.repeat)
+        return
+
+    with open(args.path, 'r', encoding='utf-8') as f:
+        count = 0
+        for count, product in enumerate(iter_js_array(f), 1):
+            print(product)
+    print(f"{count} products")
+
+
+if __name__ == "__main__":
+    main()
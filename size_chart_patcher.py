@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Add, repair and de-duplicate the size chart section of the product edit pages.
+Replaces the five one-off regex scripts (add_size_chart_to_all_edit_pages.py,
+apply_size_chart_to_edit_pages.py, complete_size_chart_implementation.py,
+fix_size_chart_placement.py, update_edit_pages_with_size_chart.py).
+
+Each page is parsed once with html.parser: size chart sections are located as the element
+that follows each <!-- Size Chart Configuration --> comment (with real div nesting, not a
+lazy regex), and the JavaScript helpers by brace matching inside <script> blocks. Every
+transform removes whatever is there and puts back the canonical version, so running the
+patcher again changes nothing. Pages are patched in parallel, one read-modify-write each.
+
+    python size_chart_patcher.py               # every pages/product-edit-product-*.html
+    python size_chart_patcher.py --dry-run     # only report which pages would change
+"""
+
+import argparse
+import glob
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+
+from atomic_write import atomic_write
+
+PAGES_GLOB = os.path.join("pages", "product-edit-product-*.html")
+
+SIZE_CHART_MARKER = "Size Chart Configuration"
+# Anchor comments the section is inserted before, in order of preference
+INSERT_BEFORE = ("Tags", "Custom Input Options")
+JS_FUNCTIONS = ("getSizeChartData", "applySizeChartPreset", "populateSizeChartFromData")
+JS_COMMENTS = ("// Size Chart Management Functions", "// Size Chart Functions")
+JS_ANCHOR = "        // Initialize after authentication\n"
+
+FORM_DATA_ANCHOR = "size_stock: sizeStock,"
+FORM_DATA_LINE = "\n                size_chart: getSizeChartData(),"
+POPULATE_ANCHOR = "document.getElementById('feature-soft-touch').checked = features.soft_touch !== false;"
+POPULATE_LINES = "\n\n            // Size Chart\n            populateSizeChartFromData(productData.size_chart);"
+LISTENER_ANCHOR = "setupSizeSelection();"
+
+SIZE_CHART_HTML = '''<!-- Size Chart Configuration -->
+<div class="space-y-4">
+    <label class="block text-sm font-medium text-text-primary mb-2">Size Chart (inches)</label>
+    <div class="glass-card rounded-lg p-4 border border-accent border-opacity-20">
+        <!-- Garment Type Presets -->
+        <div class="mb-4">
+            <label class="block text-sm text-text-secondary mb-2">Garment Type</label>
+            <select id="garment-type" class="w-full px-3 py-2 bg-surface border border-surface-light rounded text-text-primary focus:border-accent focus:outline-none">
+                <option value="adult-tshirt" selected>Adult Unisex T-Shirt (Default)</option>
+                <option value="adult-hoodie">Adult Hoodie</option>
+                <option value="kids-tshirt">Kids T-Shirt</option>
+                <option value="kids-hoodie">Kids Hoodie</option>
+                <option value="custom">Custom (Manual Input)</option>
+            </select>
+            <p class="text-xs text-text-secondary mt-1">Select a preset to auto-fill measurements, or choose Custom to enter manually</p>
+        </div>
+
+        <!-- Size Chart Inputs -->
+        <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-5 gap-4">
+            <div class="space-y-2">
+                <label class="block text-xs font-medium text-accent uppercase tracking-wide">Size S</label>
+                <div>
+                    <label class="block text-xs text-text-secondary">Chest Width</label>
+                    <input type="text" id="size-s-chest" class="w-full px-2 py-1 bg-surface border border-surface-light rounded text-text-primary text-sm focus:border-accent focus:outline-none" value="18" placeholder="18">
+                </div>
+                <div>
+                    <label class="block text-xs text-text-secondary">Length</label>
+                    <input type="text" id="size-s-length" class="w-full px-2 py-1 bg-surface border border-surface-light rounded text-text-primary text-sm focus:border-accent focus:outline-none" value="28" placeholder="28">
+                </div>
+            </div>
+            <div class="space-y-2">
+                <label class="block text-xs font-medium text-accent uppercase tracking-wide">Size M</label>
+                <div>
+                    <label class="block text-xs text-text-secondary">Chest Width</label>
+                    <input type="text" id="size-m-chest" class="w-full px-2 py-1 bg-surface border border-surface-light rounded text-text-primary text-sm focus:border-accent focus:outline-none" value="20" placeholder="20">
+                </div>
+                <div>
+                    <label class="block text-xs text-text-secondary">Length</label>
+                    <input type="text" id="size-m-length" class="w-full px-2 py-1 bg-surface border border-surface-light rounded text-text-primary text-sm focus:border-accent focus:outline-none" value="29" placeholder="29">
+                </div>
+            </div>
+            <div class="space-y-2">
+                <label class="block text-xs font-medium text-accent uppercase tracking-wide">Size L</label>
+                <div>
+                    <label class="block text-xs text-text-secondary">Chest Width</label>
+                    <input type="text" id="size-l-chest" class="w-full px-2 py-1 bg-surface border border-surface-light rounded text-text-primary text-sm focus:border-accent focus:outline-none" value="22" placeholder="22">
+                </div>
+                <div>
+                    <label class="block text-xs text-text-secondary">Length</label>
+                    <input type="text" id="size-l-length" class="w-full px-2 py-1 bg-surface border border-surface-light rounded text-text-primary text-sm focus:border-accent focus:outline-none" value="30" placeholder="30">
+                </div>
+            </div>
+            <div class="space-y-2">
+                <label class="block text-xs font-medium text-accent uppercase tracking-wide">Size XL</label>
+                <div>
+                    <label class="block text-xs text-text-secondary">Chest Width</label>
+                    <input type="text" id="size-xl-chest" class="w-full px-2 py-1 bg-surface border border-surface-light rounded text-text-primary text-sm focus:border-accent focus:outline-none" value="24" placeholder="24">
+                </div>
+                <div>
+                    <label class="block text-xs text-text-secondary">Length</label>
+                    <input type="text" id="size-xl-length" class="w-full px-2 py-1 bg-surface border border-surface-light rounded text-text-primary text-sm focus:border-accent focus:outline-none" value="31" placeholder="31">
+                </div>
+            </div>
+            <div class="space-y-2">
+                <label class="block text-xs font-medium text-accent uppercase tracking-wide">Size 2XL</label>
+                <div>
+                    <label class="block text-xs text-text-secondary">Chest Width</label>
+                    <input type="text" id="size-2xl-chest" class="w-full px-2 py-1 bg-surface border border-surface-light rounded text-text-primary text-sm focus:border-accent focus:outline-none" value="26" placeholder="26">
+                </div>
+                <div>
+                    <label class="block text-xs text-text-secondary">Length</label>
+                    <input type="text" id="size-2xl-length" class="w-full px-2 py-1 bg-surface border border-surface-light rounded text-text-primary text-sm focus:border-accent focus:outline-none" value="32" placeholder="32">
+                </div>
+            </div>
+        </div>
+    </div>
+</div>'''
+
+SIZE_CHART_JS = '''// Size Chart Management Functions
+function getSizeChartData() {
+    return {
+        S: {
+            chest: document.getElementById('size-s-chest').value || '18',
+            length: document.getElementById('size-s-length').value || '28'
+        },
+        M: {
+            chest: document.getElementById('size-m-chest').value || '20',
+            length: document.getElementById('size-m-length').value || '29'
+        },
+        L: {
+            chest: document.getElementById('size-l-chest').value || '22',
+            length: document.getElementById('size-l-length').value || '30'
+        },
+        XL: {
+            chest: document.getElementById('size-xl-chest').value || '24',
+            length: document.getElementById('size-xl-length').value || '31'
+        },
+        '2XL': {
+            chest: document.getElementById('size-2xl-chest').value || '26',
+            length: document.getElementById('size-2xl-length').value || '32'
+        }
+    };
+}
+
+function applySizeChartPreset(garmentType) {
+    const presets = {
+        'adult-tshirt': {
+            S: { chest: '18', length: '28' },
+            M: { chest: '20', length: '29' },
+            L: { chest: '22', length: '30' },
+            XL: { chest: '24', length: '31' },
+            '2XL': { chest: '26', length: '32' }
+        },
+        'adult-hoodie': {
+            S: { chest: '20', length: '26' },
+            M: { chest: '22', length: '27' },
+            L: { chest: '24', length: '28' },
+            XL: { chest: '26', length: '29' },
+            '2XL': { chest: '28', length: '30' }
+        },
+        'kids-tshirt': {
+            S: { chest: '14', length: '19' },
+            M: { chest: '15', length: '20' },
+            L: { chest: '16', length: '21' },
+            XL: { chest: '17', length: '22' },
+            '2XL': { chest: '18', length: '23' }
+        },
+        'kids-hoodie': {
+            S: { chest: '15', length: '18' },
+            M: { chest: '16', length: '19' },
+            L: { chest: '17', length: '20' },
+            XL: { chest: '18', length: '21' },
+            '2XL': { chest: '19', length: '22' }
+        }
+    };
+
+    const preset = presets[garmentType];
+    if (preset) {
+        Object.keys(preset).forEach(size => {
+            const sizeKey = size === '2XL' ? '2xl' : size.toLowerCase();
+            document.getElementById(`size-${sizeKey}-chest`).value = preset[size].chest;
+            document.getElementById(`size-${sizeKey}-length`).value = preset[size].length;
+        });
+    }
+}
+
+function populateSizeChartFromData(sizeChartData) {
+    if (!sizeChartData) return;
+
+    try {
+        const sizeChart = typeof sizeChartData === 'string' 
+            ? JSON.parse(sizeChartData) 
+            : sizeChartData;
+
+        Object.keys(sizeChart).forEach(size => {
+            const sizeKey = size === '2XL' ? '2xl' : size.toLowerCase();
+            const chestInput = document.getElementById(`size-${sizeKey}-chest`);
+            const lengthInput = document.getElementById(`size-${sizeKey}-length`);
+
+            if (chestInput && sizeChart[size].chest) {
+                chestInput.value = sizeChart[size].chest;
+            }
+            if (lengthInput && sizeChart[size].length) {
+                lengthInput.value = sizeChart[size].length;
+            }
+        });
+    } catch (error) {
+        console.error('Error populating size chart:', error);
+    }
+}'''
+
+GARMENT_TYPE_LISTENER = '''            
+            // Setup size chart preset dropdown
+            const garmentTypeSelect = document.getElementById('garment-type');
+            if (garmentTypeSelect) {
+                garmentTypeSelect.addEventListener('change', function() {
+                    if (this.value !== 'custom') {
+                        applySizeChartPreset(this.value);
+                    }
+                });
+            }'''
+
+
+class PageStructure(HTMLParser):
+    """
+    One pass over a page, recording (as character offsets) every comment, every size chart
+    section (the comment plus the element that follows it) and every <script> body.
+    """
+
+    def __init__(self, html):
+        super().__init__(convert_charrefs=False)
+        self.html = html
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', html)]
+        self.comments = []        # (text, start, end)
+        self.sections = []        # (start, end) of marker comment + following element
+        self.scripts = []         # (start, end) of script bodies
+        self._section_start = None
+        self._depth = 0
+        self._script_start = None
+        self.feed(html)
+        self.close()
+
+    def _offset(self):
+        line, col = self.getpos()
+        return self.line_starts[line - 1] + col
+
+    def handle_comment(self, data):
+        start = self._offset()
+        end = self.html.index('-->', start) + 3
+        self.comments.append((data.strip(), start, end))
+        if data.strip() == SIZE_CHART_MARKER and self._section_start is None:
+            self._section_start = start
+            self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'script':
+            self._script_start = self._offset() + len(self.get_starttag_text())
+        if self._section_start is not None and tag == 'div':
+            self._depth += 1
+
+    def handle_endtag(self, tag):
+        start = self._offset()
+        if tag == 'script' and self._script_start is not None:
+            self.scripts.append((self._script_start, start))
+            self._script_start = None
+        if self._section_start is not None and tag == 'div':
+            self._depth -= 1
+            if self._depth <= 0:
+                self.sections.append((self._section_start, self.html.index('>', start) + 1))
+                self._section_start = None
+
+
+def _line_start(html, pos):
+    """Start of pos's line if only whitespace precedes pos on it, else pos itself"""
+    start = html.rfind('\n', 0, pos) + 1
+    return start if not html[start:pos].strip() else pos
+
+
+def _after_blank_lines(html, pos):
+    """Position after the rest of pos's line and any whitespace-only lines that follow"""
+    match = re.compile(r'[ \t]*\n(?:[ \t]*\n)*').match(html, pos)
+    return match.end() if match else pos
+
+
+def _removal_span(html, start, end):
+    """
+    Span covering a block's whole lines and the blank lines after it. Surplus blank lines
+    before it are included too (one is kept), so repeated repairs never pile up blank lines.
+    """
+    start = _line_start(html, start)
+    blank_lines = 0
+    position = start
+    while position > 0 and html[position - 1] == '\n':
+        previous = html.rfind('\n', 0, position - 1) + 1
+        if html[previous:position].strip():
+            break
+        blank_lines += 1
+        if blank_lines > 1:
+            start = position
+        position = previous
+    return start, _after_blank_lines(html, end)
+
+
+def _indent(block, indent):
+    return '\n'.join(indent + line if line.strip() else '' for line in block.split('\n'))
+
+
+def _remove_spans(html, spans):
+    for start, end in sorted(spans, reverse=True):
+        html = html[:start] + html[end:]
+    return html
+
+
+def js_function_span(js, name_pos):
+    """(start, end) of the function whose 'function' keyword is at name_pos, by brace matching"""
+    pos = js.index('{', name_pos)
+    depth = 0
+    while pos < len(js):
+        char = js[pos]
+        if char in '\'"`':
+            pos += 1
+            while pos < len(js) and js[pos] != char:
+                pos += 2 if js[pos] == '\\' else 1
+        elif js.startswith('//', pos):
+            pos = js.find('\n', pos)
+            if pos == -1:
+                break
+        elif js.startswith('/*', pos):
+            pos = js.index('*/', pos) + 1
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return name_pos, pos + 1
+        pos += 1
+    raise ValueError("Unbalanced braces in JavaScript function")
+
+
+def size_chart_section_spans(html, structure):
+    """Every size chart section, with its indentation and the blank lines after it"""
+    return [_removal_span(html, start, end) for start, end in structure.sections]
+
+
+def insert_size_chart_section(html, structure):
+    for anchor in INSERT_BEFORE:
+        for text, start, _ in structure.comments:
+            if text == anchor:
+                line_start = _line_start(html, start)
+                indent = html[line_start:start]
+                block = _indent(SIZE_CHART_HTML, indent) + '\n\n'
+                return html[:line_start] + block + html[line_start:], True
+    return html, False
+
+
+def size_chart_js_spans(html, structure):
+    """Every size chart helper function (and its heading comment) inside a script block"""
+    spans = []
+    function_pattern = re.compile(r'function\s+(?:%s)\s*\(' % '|'.join(JS_FUNCTIONS))
+    comment_pattern = re.compile('|'.join(re.escape(comment) + r'[ \t]*$' for comment in JS_COMMENTS), re.M)
+    for script_start, script_end in structure.scripts:
+        for match in function_pattern.finditer(html, script_start, script_end):
+            start, end = js_function_span(html, match.start())
+            spans.append(_removal_span(html, start, end))
+        for match in comment_pattern.finditer(html, script_start, script_end):
+            spans.append(_removal_span(html, match.start(), match.end()))
+    return spans
+
+
+def insert_size_chart_js(html, scripts):
+    block = _indent(SIZE_CHART_JS, '        ') + '\n\n'
+    position = html.find(JS_ANCHOR)
+    if position == -1:
+        if not scripts:
+            return html, False
+        # No initializer to anchor on: append to the page's last script block
+        position = _line_start(html, scripts[-1][1])
+    return html[:position] + block + html[position:], True
+
+
+def ensure_after(html, anchor, addition):
+    """Insert addition right after the first anchor, unless the page already has it (idempotent)"""
+    if addition.strip() in html:
+        return html, True
+    position = html.find(anchor)
+    if position == -1:
+        return html, False
+    position += len(anchor)
+    return html[:position] + addition + html[position:], True
+
+
+def patch_page(html):
+    """
+    Apply every size chart transform to one page.
+    Returns (new_html, list of transforms that could not find their anchor).
+    """
+    missing = []
+    structure = PageStructure(html)
+    html = _remove_spans(html, size_chart_section_spans(html, structure) + size_chart_js_spans(html, structure))
+
+    # Offsets moved, so reparse once before inserting
+    structure = PageStructure(html)
+    html, found = insert_size_chart_section(html, structure)
+    if not found:
+        missing.append('section')
+    html, found = insert_size_chart_js(html, structure.scripts)
+    if not found:
+        missing.append('functions')
+
+    for name, anchor, addition in (('formData', FORM_DATA_ANCHOR, FORM_DATA_LINE),
+                                   ('populateForm', POPULATE_ANCHOR, POPULATE_LINES),
+                                   ('preset listener', LISTENER_ANCHOR, GARMENT_TYPE_LISTENER)):
+        html, found = ensure_after(html, anchor, addition)
+        if not found:
+            missing.append(name)
+    return html, missing
+
+
+def patch_file(path, dry_run=False):
+    """Worker: patch one file in a single read-modify-write. Returns (path, changed, missing)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        original = f.read()
+    patched, missing = patch_page(original)
+    changed = patched != original
+    if changed and not dry_run:
+        atomic_write(path, patched)
+    return path, changed, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add or repair the size chart section of the edit pages")
+    parser.add_argument('paths', nargs='*', help=f"pages to patch (default: {PAGES_GLOB})")
+    parser.add_argument('--dry-run', action='store_true', help="report changes without writing")
+    parser.add_argument('--workers', type=int, default=None, help="process pool size (default: one per CPU)")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob(PAGES_GLOB))
+    if not paths:
+        print("❌ No product edit pages found")
+        return
+
+    print(f"📏 {'Checking' if args.dry_run else 'Patching'} size charts in {len(paths)} edit pages...")
+    changed_count = 0
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(patch_file, path, args.dry_run) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                _, changed, missing = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"  ❌ Error patching {path}: {e}")
+                continue
+            if changed:
+                changed_count += 1
+                print(f"  ✅ {'Would update' if args.dry_run else 'Updated'} {path}")
+            if missing:
+                print(f"  ⚠️  {path}: no anchor for {', '.join(missing)}")
+
+    print(f"\n✅ {changed_count} {'would change' if args.dry_run else 'updated'}, "
+          f"{len(paths) - changed_count - failed} already up to date, {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
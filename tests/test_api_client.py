@@ -0,0 +1,48 @@
+import pytest
+
+from api_client import AdminApiClient, ApiError
+
+
+class FakeTokenProvider:
+    api_url = 'http://admin.test'
+
+    def auth_headers(self, force_refresh=False):
+        return {'Authorization': 'Bearer test'}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.requests = []
+
+    def get(self, url, params=None, headers=None):
+        self.requests.append(dict(params))
+        return FakeResponse(self.pages.pop(0))
+
+
+def test_iter_products_follows_keyset_pages():
+    session = FakeSession([{'products': [{'id': 1}, {'id': 2}], 'next_after_id': 2},
+                           {'products': [{'id': 3}], 'next_after_id': None}])
+    client = AdminApiClient(FakeTokenProvider(), session)
+
+    assert [p['id'] for p in client.iter_products(fields=['name'], page_size=2)] == [1, 2, 3]
+    assert session.requests[1] == {'limit': 2, 'after_id': 2, 'fields': 'name'}
+
+
+def test_bare_list_is_never_taken_as_the_catalog():
+    # What the server sends for an unpaged request, or while its database is down
+    session = FakeSession([[{'id': 1, 'name': 'Test Product - Database Offline'}]])
+    client = AdminApiClient(FakeTokenProvider(), session)
+
+    with pytest.raises(ApiError):
+        list(client.iter_products())
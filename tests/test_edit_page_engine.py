@@ -0,0 +1,29 @@
+from edit_page_engine import BufferedPageWriter
+
+
+def test_rewriting_existing_duplicates_removes_nothing(tmp_path):
+    pages = tmp_path / 'pages'
+    pages.mkdir()
+    (pages / 'product-edit-product-86_custom_tee.html').write_text('old')
+    (pages / 'product-edit-product-86_other_slug.html').write_text('copy')
+
+    writer = BufferedPageWriter(str(pages), fsync=False)
+    writer.write('product-edit-product-86_custom_tee.html', b'new')
+    writer.write('product-edit-product-86_other_slug.html', b'new')
+
+    assert writer.removed == 0
+    assert sorted(p.name for p in pages.iterdir()) == ['product-edit-product-86_custom_tee.html',
+                                                     'product-edit-product-86_other_slug.html']
+
+
+def test_new_name_for_renamed_product_replaces_its_generated_page(tmp_path):
+    pages = tmp_path / 'pages'
+    writer = BufferedPageWriter(str(pages), fsync=False)
+    writer.write('product-edit-product-7_old_name.html', b'page')
+    (pages / 'product-edit-product-7_hand_made.html').write_text('untracked')
+    writer.index.refresh()
+
+    assert writer.write('product-edit-product-7_new_name.html', b'page')
+    assert writer.removed == 1
+    assert sorted(p.name for p in pages.iterdir()) == ['product-edit-product-7_hand_made.html',
+                                                     'product-edit-product-7_new_name.html']
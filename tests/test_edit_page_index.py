@@ -0,0 +1,41 @@
+from edit_page_index import EditPageIndex
+
+
+def test_pages_changed_by_another_process_while_loaded_are_picked_up(tmp_path):
+    pages = tmp_path / 'pages'
+    pages.mkdir()
+    (pages / 'product-edit-product-1_a.html').write_text('one')
+    EditPageIndex(str(pages)).save()
+
+    index = EditPageIndex(str(pages))
+    # server.js creates and deletes pages on its own
+    (pages / 'product-edit-product-2_b.html').write_text('two')
+    (pages / 'product-edit-product-1_a.html').unlink()
+    index.save()
+
+    assert EditPageIndex(str(pages)).filenames() == ['product-edit-product-2_b.html']
+
+
+def test_changes_after_save_trigger_a_refresh_on_load(tmp_path):
+    pages = tmp_path / 'pages'
+    pages.mkdir()
+    (pages / 'product-edit-product-1_a.html').write_text('one')
+    EditPageIndex(str(pages)).save()
+
+    (pages / 'product-edit-product-3_c.html').write_text('three')
+    index = EditPageIndex(str(pages))
+    assert index.pages_for(3) == ['product-edit-product-3_c.html']
+    assert index.pages_for(1) == ['product-edit-product-1_a.html']
+
+
+def test_retirement_survives_a_fresh_clone_without_the_index(tmp_path):
+    pages = tmp_path / 'pages'
+    pages.mkdir()
+    index = EditPageIndex(str(pages))
+    index.retire()
+    index.save()
+
+    # The index is machine-local and not committed; the retirement record is
+    (tmp_path / '.edit_pages_index.json').unlink()
+    assert (tmp_path / 'edit_pages_retired.json').exists()
+    assert EditPageIndex(str(pages)).retired
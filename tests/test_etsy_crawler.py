@@ -0,0 +1,66 @@
+import os
+
+from etsy_crawler import SHOP_URL, FixtureFetcher, Frontier, crawl, listing_url, shop_page_url
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'etsy_shop')
+
+EVERY_PAGE = {SHOP_URL, shop_page_url(SHOP_URL, 2), listing_url('111'), listing_url('222')}
+
+
+def new_frontier(checkpoint):
+    frontier = Frontier(str(checkpoint))
+    frontier.add(SHOP_URL)
+    return frontier
+
+
+def test_interrupted_crawl_resumes_from_checkpoint(tmp_path):
+    checkpoint = tmp_path / 'checkpoint.json'
+    fetch_page = FixtureFetcher(FIXTURES)
+
+    pages, _ = crawl(fetch_page, new_frontier(checkpoint), max_pages=1)
+    assert pages == 1
+
+    resumed = Frontier(str(checkpoint))
+    assert resumed.load()
+    assert resumed.visited == {SHOP_URL}
+    assert resumed.pending == [shop_page_url(SHOP_URL, 2), listing_url('111')]
+
+    pages, images = crawl(fetch_page, resumed)
+    assert pages == 3
+    assert images == 4
+    assert resumed.visited == EVERY_PAGE
+    assert not resumed.pending
+    # Finished crawls start over instead of resuming
+    assert not Frontier(str(checkpoint)).load()
+
+
+def test_failed_page_stays_pending_until_retry_cap(tmp_path):
+    checkpoint = tmp_path / 'checkpoint.json'
+    fixtures = FixtureFetcher(FIXTURES)
+
+    def flaky(url):
+        return None if url == SHOP_URL else fixtures(url)
+
+    frontier = new_frontier(checkpoint)
+    crawl(flaky, frontier, max_pages=1)
+    resumed = Frontier(str(checkpoint))
+    assert resumed.load()
+    assert resumed.pending == [SHOP_URL]
+    assert resumed.attempts == {SHOP_URL: 1}
+
+    # The shop page recovers on the next run and its links are still discovered
+    pages, _ = crawl(FixtureFetcher(FIXTURES), resumed)
+    assert pages == 4
+    assert resumed.visited == EVERY_PAGE
+    assert not resumed.attempts
+
+
+def test_page_is_given_up_after_max_attempts(tmp_path):
+    frontier = Frontier(str(tmp_path / 'checkpoint.json'), max_attempts=2)
+    frontier.add(listing_url('999'))
+
+    pages, _ = crawl(FixtureFetcher(FIXTURES), frontier)
+    assert pages == 2
+    assert not frontier.pending
+    assert frontier.failed == {listing_url('999')}
+    assert listing_url('999') not in frontier.visited
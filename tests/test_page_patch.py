@@ -0,0 +1,88 @@
+import time
+
+from page_patch import CombinedMatcher, PatchRule, patch_file
+
+
+def rule(name, match, replacement, regex=False):
+    return PatchRule(name, '*.html', match, replacement, regex=regex)
+
+
+def test_backreference_rule_alone():
+    matcher = CombinedMatcher([rule("quoted price", r"(['\"])\$434\.78 MXN\1", r"\1$24.00\1", regex=True)])
+
+    patched, counts = matcher.apply("""price = '$434.78 MXN'; label = "$434.78 MXN"; odd = '$434.78 MXN";""")
+    assert patched == """price = '$24.00'; label = "$24.00"; odd = '$434.78 MXN";"""
+    assert counts == {"quoted price": 2}
+
+
+def test_rules_sharing_a_group_name():
+    matcher = CombinedMatcher([
+        rule("mxn", r"\$(?P<n>[\d.]+) MXN", r"$\g<n> USD", regex=True),
+        rule("eur", r"€(?P<n>[\d.]+)", r"$\g<n> USD", regex=True),
+    ])
+
+    patched, counts = matcher.apply("<p>$10.00 MXN</p><p>€5.50</p><p>$7.00 MXN</p>")
+    assert patched == "<p>$10.00 USD</p><p>$5.50 USD</p><p>$7.00 USD</p>"
+    assert counts == {"mxn": 2, "eur": 1}
+
+
+def test_grouped_and_literal_rules_keep_declaration_precedence():
+    matcher = CombinedMatcher([
+        rule("literal first", "cdn.tailwindcss.com", "/css/tailwind.css"),
+        rule("grouped", r"(cdn)\.(\w+)\.com", r"\2.example", regex=True),
+        rule("case-insensitive", r"(?i)MXN", "USD", regex=True),
+    ])
+
+    patched, counts = matcher.apply("cdn.tailwindcss.com cdn.jsdelivr.com mxn MXN cdn.tailwindcss.com")
+    # Overlapping matches are never replaced twice and earlier rules win ties
+    assert patched == "/css/tailwind.css jsdelivr.example USD USD /css/tailwind.css"
+    assert counts == {"literal first": 2, "grouped": 1, "case-insensitive": 2}
+
+
+def test_patch_file_writes_once(tmp_path):
+    page = tmp_path / 'page.html'
+    page.write_text("<span>'$434.78 MXN'</span>", encoding='utf-8')
+    rules = [PatchRule("quoted price", str(tmp_path / '*.html'), r"(['\"])\$434\.78 MXN\1", r"\1$24.00\1",
+                       regex=True)]
+
+    path, counts, diff = patch_file(str(page), rules, diff=True)
+    assert counts == {"quoted price": 1}
+    assert page.read_text(encoding='utf-8') == "<span>'$24.00'</span>"
+    assert patch_file(str(page), rules) == (str(page), {}, None)
+
+
+def test_first_declared_literal_wins_at_a_position():
+    matcher = CombinedMatcher([rule("short", "$434", "$24"), rule("long", "$434.78 MXN", "$24.00"),
+                               rule("again", "$434", "never")])
+
+    assert matcher.apply("$434.78 MXN") == ("$24.78 MXN", {"short": 1})
+
+
+def test_literal_rules_scan_as_one_group_free_pattern():
+    from revert_currency_to_usd import RULES
+
+    matcher = CombinedMatcher(RULES)
+    # Named groups would stop re from using its literal search, making the one scan slower
+    # than the separate re.sub calls it replaces
+    assert len(matcher.scanners) == 1
+    assert matcher.scanners[0][0].groups == 0
+
+    page = ("<p>" + "plain text without prices " * 40 + "</p>\n") * 200 + "$434.78 MXN $671.94 MXN"
+
+    def best_of(run, repeat=5):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def separately():
+        content = page
+        for patch_rule in RULES:
+            content = patch_rule.pattern.sub(patch_rule.replacement.replace('\\', '\\\\'), content)
+        return content
+
+    assert matcher.apply(page)[0] == separately()
+    # Generous margin: a grouped alternation was ~25x slower than the separate scans
+    assert best_of(lambda: matcher.apply(page)) < 3 * best_of(separately)
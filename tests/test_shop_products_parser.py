@@ -0,0 +1,49 @@
+import io
+
+import pytest
+
+from shop_products_parser import JSParseError, iter_js_array
+
+SHOP_SCRIPT = r"""<html><body><script>
+    // Products are listed newest first
+    const allProducts = [
+        { image: '../etsy_images/product_001/01.jpg', title: 'Kid\'s "Boo" Tee',
+          collection: 'Halloween Collection', price: '$22.00', rating: '5' },
+        /* reordered keys, extra fields, a unicode escape and a double-quoted string */
+        { "title": "Café Hoodie\n2XL", price: '$45.50', image: '../etsy_images/product_002/01.jpg',
+          rating: 4.5, collection: 'Fall', tags: ['custom', 'printed'], featured: true, sale: null, },
+        { image: '', title: 'Tab\there \\ backslash', collection: 'Basics', price: '$1e+2', rating: -1 }
+    ];
+    const otherProducts = [{ title: 'Not a product' }];
+</script></body></html>
+"""
+
+EXPECTED = [
+    {'image': '../etsy_images/product_001/01.jpg', 'title': 'Kid\'s "Boo" Tee',
+     'collection': 'Halloween Collection', 'price': '$22.00', 'rating': '5'},
+    {'title': 'Café Hoodie\n2XL', 'price': '$45.50', 'image': '../etsy_images/product_002/01.jpg',
+     'rating': 4.5, 'collection': 'Fall', 'tags': ['custom', 'printed'], 'featured': True, 'sale': None},
+    {'image': '', 'title': 'Tab\there \\ backslash', 'collection': 'Basics', 'price': '$1e+2', 'rating': -1},
+]
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 65))
+def test_products_parse_the_same_at_every_chunk_boundary(chunk_size):
+    assert list(iter_js_array(io.StringIO(SHOP_SCRIPT), chunk_size=chunk_size)) == EXPECTED
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64 * 1024])
+def test_numbers_split_across_chunks_are_not_truncated(chunk_size):
+    source = "var allProducts = [{ price: 2.5e+10, stock: 1234567890, ratio: -.75 }];"
+    assert list(iter_js_array(io.StringIO(source), chunk_size=chunk_size)) == [
+        {'price': 2.5e+10, 'stock': 1234567890, 'ratio': -0.75}]
+
+
+@pytest.mark.parametrize('source', ["let allProducts = []", "let allProducts = [];\n", "<p>no script</p>"])
+def test_empty_or_missing_array_yields_nothing(source):
+    assert list(iter_js_array(io.StringIO(source), chunk_size=3)) == []
+
+
+def test_unterminated_array_raises():
+    with pytest.raises(JSParseError):
+        list(iter_js_array(io.StringIO("const allProducts = [{ title: 'cut off' }, "), chunk_size=5))
@@ -0,0 +1,75 @@
+from size_chart_patcher import patch_page
+
+# A page the old scripts patched twice: two size chart sections (one stale) and two
+# copies of the helper functions, one with a brace inside a string
+PATCHED_TWICE = """<form>
+    <!-- Size Chart Configuration -->
+    <div class="space-y-4"><div>stale chart</div></div>
+
+    <!-- Size Chart Configuration -->
+    <div class="space-y-4">
+        <div>duplicate chart</div>
+    </div>
+
+    <!-- Tags -->
+    <div>tags</div>
+</form>
+<script>
+        // Size Chart Functions
+        function getSizeChartData() {
+            return {};
+        }
+
+        function getSizeChartData() {
+            return { note: '}' };
+        }
+
+        function applySizeChartPreset(type) {
+        }
+
+        function collectFormData() {
+            return {
+                size_stock: sizeStock,
+                size_chart: getSizeChartData(),
+            };
+        }
+
+        function populateForm(productData, features) {
+            document.getElementById('feature-soft-touch').checked = features.soft_touch !== false;
+        }
+
+        setupSizeSelection();
+        // Initialize after authentication
+        init();
+</script>
+"""
+
+
+def test_duplicates_are_normalized_to_one_section_and_one_set_of_helpers():
+    html, missing = patch_page(PATCHED_TWICE)
+
+    assert missing == []
+    assert html.count('<!-- Size Chart Configuration -->') == 1
+    assert 'stale chart' not in html and 'duplicate chart' not in html
+    assert html.index('<!-- Size Chart Configuration -->') < html.index('<!-- Tags -->')
+    for name in ('getSizeChartData', 'applySizeChartPreset', 'populateSizeChartFromData'):
+        assert html.count(f'function {name}(') == 1
+    assert html.count('size_chart: getSizeChartData(),') == 1
+    assert html.count('populateSizeChartFromData(productData.size_chart);') == 1
+    assert html.count("getElementById('garment-type');") == 1
+
+
+def test_second_patch_changes_nothing():
+    once, _ = patch_page(PATCHED_TWICE)
+    twice, missing = patch_page(once)
+
+    assert twice == once
+    assert missing == []
+
+
+def test_missing_anchors_are_reported():
+    page = "<form>\n    <div>no anchors here</div>\n</form>\n<script>\n        init();\n</script>\n"
+    html, missing = patch_page(page)
+
+    assert missing == ['section', 'formData', 'populateForm', 'preset listener']
+    assert '<!-- Size Chart Configuration -->' not in html
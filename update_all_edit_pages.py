@@ -4,11 +4,14 @@ Script to update ALL existing edit pages with complete functionality.
 This will replace all the old edit pages with the new comprehensive format.
 """
 
-import os
+import argparse
 import re
 import json
 import requests
 
+from edit_page_engine import BufferedPageWriter, add_engine_arguments, render_edit_pages
+from edit_page_index import RETIRED_NOTICE
+
 def clean_product_name(name):
     """Clean product name for use in filename"""
     if not name:
@@ -204,7 +207,7 @@ def create_complete_edit_page_content(product_id, product_name, product_data):
                         <label for="product-category" class="form-label">Category</label>
                         <select id="product-category" class="form-input">
                             <option value="Halloween" {'selected' if category == 'Halloween' else ''}>Halloween</option>
-                            <option value="Father\'s Day" {'selected' if category == 'Father\'s Day' else ''}>Father's Day</option>
+                            <option value="Father\'s Day" {'selected' if category == "Father's Day" else ''}>Father's Day</option>
                             <option value="Birthday" {'selected' if category == 'Birthday' else ''}>Birthday</option>
                             <option value="Custom" {'selected' if category == 'Custom' else ''}>Custom</option>
                             <option value="Cancer Awareness" {'selected' if category == 'Cancer Awareness' else ''}>Cancer Awareness</option>
@@ -528,41 +531,11 @@ def create_complete_edit_page_content(product_id, product_name, product_data):
     
     return html_content
 
-def get_existing_edit_pages():
-    """Get list of existing edit page filenames"""
-    pages_dir = "pages"
-    existing_pages = []
-    
-    if os.path.exists(pages_dir):
-        for filename in os.listdir(pages_dir):
-            if filename.startswith("product-edit-product-") and filename.endswith(".html"):
-                existing_pages.append(filename)
-    
-    return existing_pages
-
-def extract_product_id_from_filename(filename):
-    """Extract product ID from edit page filename"""
-    match = re.search(r'product-edit-product-(\d+)_', filename)
-    if match:
-        return int(match.group(1))
-    return None
-
-def get_product_data_from_filename(filename):
-    """Extract product name from filename and create basic product data"""
-    # Extract product name from filename
-    match = re.search(r'product-edit-product-\d+_(.+)\.html', filename)
-    if match:
-        product_name = match.group(1).replace('_', ' ').title()
-    else:
-        product_name = "Unknown Product"
-    
-    # Extract product ID
-    product_id = extract_product_id_from_filename(filename)
-    
-    # Create basic product data
+def get_product_data_from_index(index, filename):
+    """Basic product data for a page, named as recorded in the edit page index"""
     return {
-        "id": product_id,
-        "name": product_name,
+        "id": index.get(filename)['id'],
+        "name": index.name_for(filename),
         "description": "",
         "price": 22.00,
         "original_price": 26.40,
@@ -591,33 +564,40 @@ def get_product_data_from_filename(filename):
     }
 
 def main():
+    parser = argparse.ArgumentParser(description="Regenerate every existing edit page with complete functionality")
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+
     print("🔍 Updating ALL existing edit pages with complete functionality...")
     
-    # Get existing edit pages
-    existing_pages = get_existing_edit_pages()
+    # Existing edit pages, from the edit page index
+    writer = BufferedPageWriter()
+    if writer.index.retired:
+        print(RETIRED_NOTICE)
+        return
+    existing_pages = writer.index.filenames()
     print(f"📁 Found {len(existing_pages)} existing edit pages")
     
     # Update each edit page
-    pages_dir = "pages"
-    updated_count = 0
-    
+    jobs = []
     for filename in existing_pages:
-        product_data = get_product_data_from_filename(filename)
+        product_data = get_product_data_from_index(writer.index, filename)
         product_id = product_data['id']
         product_name = product_data['name']
-        
-        # Create the complete edit page content
-        content = create_complete_edit_page_content(product_id, product_name, product_data)
-        
-        # Write the updated file
-        filepath = os.path.join(pages_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+        jobs.append((filename, create_complete_edit_page_content, (product_id, product_name, product_data)))
+    
+    updated_count = 0
+    for filename, written, error in render_edit_pages(jobs, args.workers, compiled=args.compiled_template,
+                                                      writer=writer):
+        if error:
+            print(f"❌ Error updating {filename}: {error}")
+            continue
         updated_count += 1
-        print(f"✅ Updated: {filename}")
+        if written:
+            print(f"✅ Updated: {filename}")
     
     print(f"🎉 Successfully updated {updated_count} edit pages with complete functionality!")
+    print(f"📊 Pages: {writer.summary()}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,10 +4,12 @@ Script to update edit pages to dynamically load REAL data from the database.
 This will make each edit page fetch its own data when it loads, so you can see the actual current data.
 """
 
-import os
-import re
+import argparse
 import json
 
+from edit_page_engine import BufferedPageWriter, add_engine_arguments, render_edit_pages
+from edit_page_index import RETIRED_NOTICE
+
 def create_dynamic_edit_page_content(product_id, product_name):
     """Create an edit page that dynamically loads real data from the database"""
     
@@ -553,62 +555,40 @@ def create_dynamic_edit_page_content(product_id, product_name):
     
     return html_content
 
-def get_existing_edit_pages():
-    """Get list of existing edit page filenames"""
-    pages_dir = "pages"
-    existing_pages = []
-    
-    if os.path.exists(pages_dir):
-        for filename in os.listdir(pages_dir):
-            if filename.startswith("product-edit-product-") and filename.endswith(".html"):
-                existing_pages.append(filename)
-    
-    return existing_pages
-
-def extract_product_id_from_filename(filename):
-    """Extract product ID from edit page filename"""
-    match = re.search(r'product-edit-product-(\d+)_', filename)
-    if match:
-        return int(match.group(1))
-    return None
-
-def extract_product_name_from_filename(filename):
-    """Extract product name from filename"""
-    match = re.search(r'product-edit-product-\d+_(.+)\.html', filename)
-    if match:
-        product_name = match.group(1).replace('_', ' ').title()
-    else:
-        product_name = "Unknown Product"
-    return product_name
-
 def main():
+    parser = argparse.ArgumentParser(description="Regenerate edit pages that load their data dynamically")
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+
     print("🔍 Updating all edit pages to dynamically load REAL data...")
     
-    # Get existing edit pages
-    existing_pages = get_existing_edit_pages()
+    # Existing edit pages, from the edit page index
+    writer = BufferedPageWriter()
+    if writer.index.retired:
+        print(RETIRED_NOTICE)
+        return
+    existing_pages = writer.index.filenames()
     print(f"📁 Found {len(existing_pages)} existing edit pages")
     
     # Update each edit page
-    pages_dir = "pages"
-    updated_count = 0
-    
+    jobs = []
     for filename in existing_pages:
-        product_id = extract_product_id_from_filename(filename)
-        product_name = extract_product_name_from_filename(filename)
-        
-        if product_id:
-            # Create the dynamic edit page content
-            content = create_dynamic_edit_page_content(product_id, product_name)
-            
-            # Write the updated file
-            filepath = os.path.join(pages_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            updated_count += 1
+        product_id = writer.index.get(filename)['id']
+        product_name = writer.index.name_for(filename)
+        jobs.append((filename, create_dynamic_edit_page_content, (product_id, product_name)))
+    
+    updated_count = 0
+    for filename, written, error in render_edit_pages(jobs, args.workers, compiled=args.compiled_template,
+                                                      writer=writer):
+        if error:
+            print(f"❌ Error updating {filename}: {error}")
+            continue
+        updated_count += 1
+        if written:
             print(f"✅ Updated: {filename} to load REAL data dynamically")
     
     print(f"🎉 Successfully updated {updated_count} edit pages!")
+    print(f"📊 Pages: {writer.summary()}")
     print("📝 Now when you click 'Edit' on any product, it will:")
     print("   1. Show a loading spinner")
     print("   2. Fetch the REAL data from your database")